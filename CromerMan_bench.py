@@ -0,0 +1,198 @@
+from __future__ import print_function
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import numpy as np
+
+import CromerMan
+from CromerMan import Cromer, _DATA
+
+# ~ accuracy regression and throughput of CromerMan
+# ~
+# ~   python3 CromerMan_bench.py [--out out.json]   check + timing, exit 1 on a regression
+# ~   python3 CromerMan_bench.py --reference        rebuild CromerMan_data/cromer_ref.npz
+# ~
+# ~ the reference holds f0 (all Cromer-Mann atoms and ions, on a Q grid) and
+# ~ f', f'', mu/rho of _fpE (H..Cf, on a keV grid); cromer_check() compares the
+# ~ current _f0Q, _f0Qv, _fpE, _fpEv with TOL and _fpEt with its documented error
+# ~ (Cromer._fpEt), cromer_bench() times them and writes both to a json file
+# ~ (one per version / machine, to be compared across versions)
+
+REF = os.path.join(_DATA, 'cromer_ref.npz')
+REF_Q = np.linspace(0.0, 25.0, 26)      # 1/A
+REF_KEV = np.geomspace(1.0, 100.0, 41)  # keV
+REF_ZMAX = 98                           # Cf
+
+TOL = {
+    'f0':   1.0e-10,    # e-, absolute
+    'fp':   1.0e-8,     # e-, absolute
+    'fpp':  1.0e-8,     # e-, absolute
+    'pmu':  1.0e-10,    # relative
+    }
+
+# ~ _fpEt: (distance to the nearest edge / pole relative to E, |dfp|, |dfpp|, |dpmu|/pmu)
+TOL_TABLE = (
+    (1.0e-2, 0.02, 0.01, 1.0e-4),
+    (1.0e-3, 0.6, 0.02, 2.0e-4),
+    )
+
+
+def _elements(CM):
+    return [ CM.ElemAtomZ[iz] for iz in range(1, REF_ZMAX+1) ]
+
+
+def _fpE_grid(CM, atoms, keV):
+    # ~ (3, atoms, keV): fp, fpp, pmu of the scalar _fpE
+    R = np.zeros((3, len(atoms), len(keV)))
+    for i, atm in enumerate(atoms):
+        for j, E in enumerate(keV):
+            R[:, i, j] = CM._fpE(atm, float(E))
+    return R
+
+
+def cromer_reference_save(path=REF):
+    # ~ (re)build the reference from the current code: only after a change of
+    # ~ the tables or of the algorithm that is meant to change the values
+    CM = Cromer()
+    names = [ str(n) for n in CM.db.f0_abc_name ]
+    elem = _elements(CM)
+    np.savez(path,
+        f0_name=np.array(names), Q=REF_Q, f0=CM._f0Qv(names, REF_Q),
+        fp_name=np.array(elem), keV=REF_KEV, fpE=_fpE_grid(CM, elem, REF_KEV))
+    print('CromerMan reference saved in', path)
+
+
+def _dev(name, got, ref, tol, rel=False):
+    d = np.abs(np.asarray(got, dtype=float) - ref)
+    if rel:
+        d = d / np.maximum(np.abs(ref), 1.0e-300)
+    i = np.unravel_index(np.argmax(d), d.shape)
+    return {'max': float(d[i]), 'at': [ int(k) for k in i ], 'tol': tol,
+            'ok': bool(d[i] <= tol), 'name': name}
+
+
+def cromer_check(path=REF, table=True):
+    # ~ the deviations from the reference: { test: {max, at, tol, ok} }
+    ref = np.load(path)
+    CM = Cromer()
+    res = {}
+
+    names = list(ref['f0_name'])
+    f0 = ref['f0']
+    res['f0Qv'] = _dev('f0', CM._f0Qv(names, ref['Q']), f0, TOL['f0'])
+    # ~ _f0Q takes the element names only, not the ions
+    rows = [ i for i, n in enumerate(names) if n.capitalize() in CM.ElemNumb ]
+    got = [ [ CM._f0Q(names[i].capitalize(), q) for q in ref['Q'] ] for i in rows ]
+    res['f0Q'] = _dev('f0', got, f0[rows], TOL['f0'])
+
+    elem = list(ref['fp_name'])
+    keV = ref['keV']
+    R = ref['fpE']
+    G = _fpE_grid(CM, elem, keV)
+    GV = np.array([ CM._fpEv(atm, keV) for atm in elem ]).transpose(1, 0, 2)
+    for fn, g in (('fpE', G), ('fpEv', GV)):
+        res[fn+'_fp'] = _dev('fp', g[0], R[0], TOL['fp'])
+        res[fn+'_fpp'] = _dev('fpp', g[1], R[1], TOL['fpp'])
+        res[fn+'_pmu'] = _dev('pmu', g[2], R[2], TOL['pmu'], rel=True)
+
+    if table:
+        GT = np.array([ CM._fpEt(atm, keV) for atm in elem ]).transpose(1, 0, 2)
+        dist = np.full(R.shape[1:], np.inf)
+        for i, atm in enumerate(elem):
+            if int(CM.ElemNumb[atm]) > 2:
+                P = CM._fpE_poles(atm)
+                dist[i] = np.abs(keV[:, None] / P - 1.0).min(1)
+        d0 = np.inf
+        for d, tfp, tfpp, tpmu in TOL_TABLE:
+            m = (dist > d) & (dist <= d0)
+            d0 = d
+            key = 'fpEt_%g' % d
+            res[key+'_fp'] = _dev('fp', GT[0][m], R[0][m], tfp)
+            res[key+'_fpp'] = _dev('fpp', GT[1][m], R[1][m], tfpp)
+            res[key+'_pmu'] = _dev('pmu', GT[2][m], R[2][m], tpmu, rel=True)
+    return res
+
+
+def _timeit(f, n=1):
+    # ~ best of 3, seconds per call
+    best = np.inf
+    for _ in range(3):
+        t = time.perf_counter()
+        for _ in range(n):
+            f()
+        best = min(best, (time.perf_counter() - t) / n)
+    return best
+
+
+def cromer_bench(keV=10.0):
+    # ~ the timings (us): Cromer() cold (tables loaded) and warm, _f0Q, _f0Qv,
+    # ~ and per element _fpE, _fpEv on REF_KEV, _fpEt
+    res = {}
+
+    def _cold():
+        Cromer._db = None
+        Cromer()
+    res['Cromer_cold'] = _timeit(_cold) * 1e6
+    res['Cromer'] = _timeit(Cromer, 1000) * 1e6
+
+    CM = Cromer()
+    elem = _elements(CM)
+    f0e = [ a for a in elem if a.upper() in CM.db.f0_abc_row ]
+    res['f0Q'] = _timeit(lambda: [ CM._f0Q(a, 1.0) for a in f0e ]) / len(f0e) * 1e6
+    res['f0Qv_atoms_x_Q'] = [len(f0e), len(REF_Q)]
+    res['f0Qv'] = _timeit(lambda: CM._f0Qv(f0e, REF_Q), 10) * 1e6
+
+    res['fpE'], res['fpEv_grid'], res['fpEt'] = {}, {}, {}
+    for a in elem:
+        res['fpE'][a] = _timeit(lambda: CM._fpE(a, keV), 2) * 1e6
+        res['fpEv_grid'][a] = _timeit(lambda: CM._fpEv(a, REF_KEV)) * 1e6
+        CM._fpEt(a, keV)    # table built / loaded outside the timing
+        res['fpEt'][a] = _timeit(lambda: CM._fpEt(a, keV), 100) * 1e6
+    for k in ('fpE', 'fpEv_grid', 'fpEt'):
+        res[k+'_mean'] = float(np.mean(list(res[k].values())))
+    res['fpEv_grid_points'] = len(REF_KEV)
+    return res
+
+
+def _version():
+    here = os.path.dirname(os.path.abspath(CromerMan.__file__))
+    try:
+        git = subprocess.check_output(['git', 'describe', '--always', '--dirty'],
+            cwd=here, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        git = ''
+    return {'git': git, 'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'node': platform.node(),
+            'date': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+
+def main(out='cromer_bench.json'):
+    check = cromer_check()
+    bench = cromer_bench()
+    ok = all(c['ok'] for c in check.values())
+    for k, c in check.items():
+        print('%-16s %-4s max %9.3g  tol %9.3g  at %s' %
+            (k, 'ok' if c['ok'] else '!!!', c['max'], c['tol'], c['at']))
+    print('Cromer() cold %.0f us, warm %.1f us; _f0Q %.1f us; _fpE %.0f us, _fpEt %.1f us per call' %
+        (bench['Cromer_cold'], bench['Cromer'], bench['f0Q'], bench['fpE_mean'], bench['fpEt_mean']))
+    with open(out, 'w') as f:
+        json.dump({'version': _version(), 'ok': ok, 'check': check, 'timing_us': bench}, f, indent=1)
+    print('results in', out)
+    return ok
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description='CromerMan accuracy regression and timing')
+    ap.add_argument('--out', default='cromer_bench.json',
+        help='json file of the checks and timings (default: %(default)s)')
+    ap.add_argument('--reference', action='store_true',
+        help='rebuild the reference ' + REF + ' from the current code and exit')
+    args = ap.parse_args()
+    if args.reference:
+        cromer_reference_save()
+    else:
+        sys.exit(0 if main(args.out) else 1)
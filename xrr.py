@@ -1,5 +1,7 @@
 import wx
+import os
 import sys
+import threading
 
 import time
 import numpy as np
@@ -7,6 +9,7 @@ import scipy
 from scipy.optimize import curve_fit
 from scipy.optimize import minimize
 from scipy.optimize import differential_evolution
+from scipy.special import erf
 
 import matplotlib.pyplot as plt
 import CromerMan
@@ -41,6 +44,9 @@ class _XLayer:
     _dd = 0  # thickness A
     _sg = 0  # roughness A
     _rh = 0  # density g/cm^3
+    _rhb = 0  # bulk density g/cm^3, 6th column of the layer file, 0 = unknown
+    _blk = 0  # repeat block id, 0 = not in a block
+    _rep = 1  # number of periods of the repeat block
     
     _hd = ['Name', 'Composition', 'd [A]', 'sg [A]', 'rho [g/cm^3]', 'Mm [g/mol]', 'Vm [A^3]']
     
@@ -72,12 +78,13 @@ class _XLayer:
     _keV = 8.9
     
     
-    def __init__(self, name="", comp="", d=1.0, s=0.0, r=1.0, M=1.0, V=1.0):
+    def __init__(self, name="", comp="", d=1.0, s=0.0, r=1.0, M=1.0, V=1.0, rb=0.0):
         self._name = name
         self._comp = comp
         self._dd = d  # thickness     A
         self._sg = s  # roughness     A
         self._rh = r  # density       g/cm^3
+        self._rhb = rb # bulk density g/cm^3, 0 = unknown
         self._Mm = M  # molar Mass    g
         self._Vm = V  # molar Volume  m^3
         
@@ -104,15 +111,8 @@ class _XLayer:
         self.SF   = np.array(qq, dtype=np.complex_)   # scattering factor for layer
         self.SFa = []
         #https://periodictable.readthedocs.io/en/latest/api/xsf.html
-        self.SLD  = np.array(qq, dtype=np.complex_)   # SLD scattering length density
-        self.K   = np.array(qq, dtype=np.complex_)    # wave-vector k
-        self.F   = np.array(qq, dtype=np.complex_)   # Fresnel
-        self.Phi  = np.array(qq, dtype=np.complex_)  # phase
-        self.Atn  = np.array(qq, dtype=np.complex_)     # attenuation
-        self.FA  = np.array(qq, dtype=np.complex_)      #Fresnel w. attn
-        self.Bt   = np.array(qq, dtype=np.complex_)    # betha
-        self.R   = np.array(qq, dtype=np.complex_)    # reflectivity (complex)
-        self.R2 = np.array(qq)                          #refl. int.
+        # ~ SLD is set by f_SLD(); K, F, Phi, Atn, FA, Bt, R, R2 are copied
+        # ~ from the layer stack arrays by XRR.layer_waves() when asked for
         
         
     def f_keV(self, keV):
@@ -127,12 +127,12 @@ class _XLayer:
         # ~ input is "Atom name", Q = 2*pi/d=4*pi*sin(theta)/Lambda [A^-1], and energy in keV
         # ~ returns Complex f0+fp + i* fpp   in [electron units]        
         self.f_keV(keV)
-        for atm, AN in zip(self.AtomS, self.AtomN):
-            f0 = Cromer()._f0Q(atm, qq)
-            fp = Cromer()._fpE(atm, keV)
-            asfwv = f0 + fp[0] + fp[1]*1j 
-            self.SFa.append(asfwv)
-            self.SF += asfwv*AN
+        CM = Cromer()   # cheap, the tables are shared
+        if len(self.AtomS) == 0:
+            return
+        asf = CM._asfv(self.AtomS, qq, keV)    # (atoms, q), cached by (atm, keV, qq)
+        self.SFa.extend(asf)
+        self.SF += self.AtomN @ asf
             
     def f_SLD(self):
         self.SLD = self._re*1.0E-14*(self._Na*self._rh/self._Mm)*self.SF
@@ -171,7 +171,943 @@ class _XLayer:
         return t
 
 
+
+class _XWork:
+    # ~ scratch arrays kept between evaluations, one per (name, shape, dtype),
+    # ~ so the hot path fills them in place (out=) instead of allocating
+    def __init__(self):
+        self.buf = {}
+
+    def get(self, name, shape, dtype=complex):
+        key = (name, tuple(shape), np.dtype(dtype).char)
+        b = self.buf.get(key)
+        if b is None:
+            b = self.buf[key] = np.empty(shape, dtype=dtype)
+        return b
+
+    def clear(self):
+        self.buf = {}
+
+
+EXPLIM = (-700.0, 50.0)  # range kept for the real part of the exponents
+
+# ~ refl_batch(): bytes of one (candidates, nL, nq) complex array per chunk;
+# ~ the pass is elementwise, a chunk only saves the per-call overhead of small
+# ~ q grids and beyond this size falls out of the cache (XRR.xrr_bench_batch(),
+# ~ 8 layers, us/candidate: nq 100 42 vs 90 one by one, nq 300 126 vs 144,
+# ~ nq >= 1000 one candidate per chunk, no gain over a serial xrr(): there
+# ~ batching is a convenience, not a speed-up)
+BATCH_BYTES = 128*1024
+
+# ~ _XObjective.jac(): the analytic Jacobian (refl() + refl_jac()) costs
+# ~ 3.6-3.9 models of the 8-layer test stack, counted as 4 against the
+# ~ evaluation budget of a multi-start fit
+JAC_COST = 4
+
+# ~ XRR.fit() L-M with fit_lin(): ftol of curve_fit, see fitmode 0
+FTOL_LIN = 1.0E-5
+
+
+def batch_size(nL, nq, dtype=complex):
+    # ~ candidates per refl_batch() chunk for BATCH_BYTES
+    return max(1, BATCH_BYTES // (nL*nq*np.dtype(dtype).itemsize))
+
+
+def expclip(Z, clip=None):
+    # ~ exp(Z) with Re(Z) clipped to EXPLIM, in place on Z
+    # ~ below: the factor is 0 to double precision anyway, but left as is it
+    # ~ underflows to slow subnormals; above: only reached far outside the
+    # ~ model (Nevot-Croce with sg >> 1/K, or a gain layer), it would overflow
+    # ~ clip : list, the number of entries clipped above is appended to it,
+    # ~ these are the ones that change the result
+    # ~ in single precision the range is narrowed to fit float32, and kept
+    # ~ well above its subnormals, which the recursion would produce
+    # ~ exp(x + iy) = exp(x) (cos y + i sin y) on the real and imaginary parts
+    # ~ is several times faster than the complex np.exp
+    Zr = Z.real
+    Zi = Z.imag
+    lo, hi = EXPLIM
+    if Zr.dtype == np.float32:
+        lo, hi = -60.0, 20.0
+    n = np.count_nonzero(Zr > hi)
+    np.clip(Zr, lo, hi, out=Zr)
+    if clip is not None:
+        clip.append(n)
+    E = np.exp(Zr)      # not in place: strided out= is slow for float32
+    C = np.cos(Zi)
+    S = np.sin(Zi)
+    np.multiply(E, C, out=Zr)
+    np.multiply(E, S, out=Zi)
+    return Z
+
+
+def interfaces(K, dd, sg, FA, Bt, l0=1, clip=None, ws=None):
+    # ~ FA[l], Bt[l] of the interfaces (l-1 -> l), l = l0..top, row 0 is unused
+    # ~ ws : _XWork for the scratch array, a fresh one if None
+    ws = ws if ws is not None else _XWork()
+    K0 = K[..., l0-1:-1, :]
+    K1 = K[..., l0:, :]
+    FA1 = FA[..., l0:, :]
+    Bt1 = Bt[..., l0:, :]
+    T = ws.get('ifc', K.shape, K.dtype)[..., l0:, :]
+    np.subtract(K1, K0, out=FA1)
+    FA1 /= np.add(K1, K0, out=T)                                  # Fresnel
+    np.multiply(K1, K0, out=T)
+    T *= -sg[..., l0-1:-1, :]**2
+    FA1 *= expclip(T, clip)                                         # w. attn.
+    np.multiply(K1, -2.0*1j*np.abs(dd[..., l0:, :]), out=Bt1)
+    expclip(Bt1, clip)                                              # betha
+
+
+def parratt(K, dd, sg, FA, Bt, R, l0=1, blk=(), clip=None, ws=None):
+    # ~ Parratt recursion along the layer axis (-2), substrate first
+    # ~ K, FA, Bt, R : (..., nL, nq) complex,  dd, sg : (..., nL, 1)
+    # ~ only the interfaces l0..top are (re)computed, R[l0-1] is taken as is
+    # ~ blk : [first, last, periods] of the repeat blocks, see layer_blocks();
+    # ~ R[first..last-1] hold the first period, R[last] the whole block
+    # ~ clip : list collecting the clipped exponent counts, see expclip()
+    # ~ ws : _XWork for the scratch arrays, a fresh one if None
+    ws = ws if ws is not None else _XWork()
+    interfaces(K, dd, sg, FA, Bt, l0, clip, ws)
+    R[..., 0, :] = 0.0
+    blast = { b[1]: b for b in blk }
+    A = ws.get('rA', R[..., 0, :].shape, R.dtype)
+    B = ws.get('rB', R[..., 0, :].shape, R.dtype)
+    for l in range(l0, K.shape[-2]):
+        R0 = R[..., l-1, :]
+        F  = FA[..., l, :]
+        np.add(R0, F, out=A)
+        np.multiply(R0, F, out=B)
+        B += 1.0
+        A /= B
+        np.multiply(Bt[..., l, :], A, out=R[..., l, :])
+        if l in blast:
+            P = mobius_repeat(K, sg, FA, Bt, *blast[l], clip=clip)
+            if P is not None:
+                RP = R[..., l, :]
+                R[..., l, :] = (P[0, 0]*RP + P[0, 1])/(P[1, 0]*RP + P[1, 1])
+    return R[..., -1, :]
+
+
+def abeles(K, dd, sg, FA, Bt, blk=(), clip=None, ws=None):
+    # ~ transfer-matrix (Abeles) form of parratt(), same arrays and result
+    # ~ the characteristic matrix of a layer, rescaled by exp(-iKd) so that it
+    # ~ cannot overflow, is mobius(Bt, FA); the stack is the product of these,
+    # ~ reduced pairwise, each level in one go over all layers and q
+    interfaces(K, dd, sg, FA, Bt, 1, clip, ws)
+    MA = mobius(Bt[..., 1:, :], FA[..., 1:, :])     # (2, 2, ..., nL-1, nq)
+    if blk:
+        MS = []
+        l = 1
+        for a, b, n in blk:
+            MS.append(MA[..., l-1:a-1, :])
+            M = MA[..., a-1, :]
+            for m in range(a+1, b+1):
+                M = mobius_mul(MA[..., m-1, :], M)
+            P = mobius_repeat(K, sg, FA, Bt, a, b, n, clip)
+            if P is not None:
+                M = mobius_mul(P, M)
+            MS.append(M[..., None, :])
+            l = b+1
+        MS.append(MA[..., l-1:, :])
+        MA = np.concatenate(MS, axis=-2)
+    while MA.shape[-2] > 1:
+        n = MA.shape[-2]
+        M = mobius_mul(MA[..., 1:n:2, :], MA[..., 0:n-1:2, :])
+        if n % 2:
+            M = np.concatenate([M, MA[..., n-1:, :]], axis=-2)
+        MA = M
+    return MA[0, 1, ..., 0, :]/MA[1, 1, ..., 0, :]
+
+
+def mobius(Bt, FA):
+    # ~ R -> Bt*(R + FA)/(1 + R*FA)  as the 2x2 matrix [[Bt, Bt*FA], [FA, 1]]
+    # ~ the matrix indices come first: M[i, j] is an array shaped like Bt
+    M = np.empty((2, 2) + Bt.shape, dtype=Bt.dtype)
+    M[0, 0] = Bt
+    M[0, 1] = Bt*FA
+    M[1, 0] = FA
+    M[1, 1] = 1.0
+    return M
+
+
+def mobius_mul(A, B):
+    # ~ A @ B, rescaled: the map only depends on the ratios of the elements
+    M = np.empty((2, 2) + np.broadcast(A[0, 0], B[0, 0]).shape, dtype=A.dtype)
+    M[0, 0] = A[0, 0]*B[0, 0] + A[0, 1]*B[1, 0]
+    M[0, 1] = A[0, 0]*B[0, 1] + A[0, 1]*B[1, 1]
+    M[1, 0] = A[1, 0]*B[0, 0] + A[1, 1]*B[1, 0]
+    M[1, 1] = A[1, 0]*B[0, 1] + A[1, 1]*B[1, 1]
+    M /= np.abs(M).max(axis=(0, 1))
+    return M
+
+
+def mobius_repeat(K, sg, FA, Bt, first, last, periods, clip=None):
+    # ~ matrix of periods-1 further periods on top of the first one (None if
+    # ~ periods < 2): one period (last -> first wrap, then first+1..last) as a
+    # ~ matrix product, raised to periods-1 by repeated squaring: O(log periods)
+    Ka = K[..., first, :]
+    Kb = K[..., last, :]
+    FAw = (Ka - Kb)/(Ka + Kb)*expclip(-Ka*Kb*sg[..., last, :]**2, clip)
+    M = mobius(Bt[..., first, :], FAw)
+    for l in range(first+1, last+1):
+        M = mobius_mul(mobius(Bt[..., l, :], FA[..., l, :]), M)
+    n = periods - 1
+    P = None
+    while n:
+        if n & 1:
+            P = M if P is None else mobius_mul(M, P)
+        n >>= 1
+        if n:
+            M = mobius_mul(M, M)
+    return P
+
+
+def microslab(SLD, q2, dd, sg, dz=0.5, tol=1.0E-3, nmax=400, clip=None):
+    # ~ top-layer R of the erf-graded profile of layer_profile(), sliced
+    # ~ SLD : (nL, nq) of the layers,  q2 : (nq,) = q^2/4,  dd, sg : (nL, 1)
+    # ~ the profile is SLD_0 + sum_i (SLD_i+1 - SLD_i) (1 + erf((z - z_i)/sg_i))/2
+    # ~ cut into slabs of dz A (taken at the slab middle; a sharp step is taken
+    # ~ as the fraction of the slab above it), runs of slabs whose SLD (at the first q) stays
+    # ~ within tol*max|SLD| are merged, tol is doubled until at most nmax are
+    # ~ left; the slabs (sharp, sg = 0) then go through parratt()
+    nL = SLD.shape[-2]
+    zi = np.cumsum(np.abs(dd[1:, 0]))           # interface i -> i+1 at zi[i]
+    zi = np.concatenate([[0.0], zi[:-1]])
+    si = np.abs(sg[:-1, 0])
+    zlo = np.min(zi - 3.0*si) - dz
+    zhi = np.max(zi + 3.0*si) + dz
+    nz = int(np.ceil((zhi - zlo)/dz))
+    zm = zlo + dz*(np.arange(nz) + 0.5)         # slab mid-points
+    H = np.empty((nz, nL-1))                    # fraction above interface i
+    rough = si > 0
+    H[:, rough] = 0.5*(1.0 + erf((zm[:, None] - zi[rough])/si[rough]))
+    H[:, ~rough] = np.clip((zm[:, None] - zi[~rough])/dz + 0.5, 0.0, 1.0)
+    W = np.empty((nz, nL))                      # fraction of each layer
+    W[:, 0] = 1.0 - H[:, 0]
+    W[:, 1:-1] = H[:, :-1] - H[:, 1:]
+    W[:, -1] = H[:, -1]
+    
+    S0 = W @ SLD[:, 0]
+    h = tol*np.abs(S0).max()
+    while h > 0:
+        qz = np.round(S0.real/h) + 1j*np.round(S0.imag/h)
+        first = np.flatnonzero(np.concatenate([[True], qz[1:] != qz[:-1]]))
+        if len(first) <= nmax:
+            break
+        h = 2.0*h
+    else:
+        first = np.arange(nz)
+    ns = np.diff(np.append(first, nz))          # dz slabs per merged slab
+    Wm = np.add.reduceat(W, first, axis=0)/ns[:, None]
+    
+    S  = np.concatenate([SLD[:1], Wm @ SLD, SLD[-1:]])
+    dm = np.concatenate([[0.0], dz*ns, [0.0]])[:, None]
+    K  = np.sqrt(q2 - 4.0*np.pi*(S - S[-1]))
+    FA = np.ones_like(K)
+    Bt = np.ones_like(K)
+    R  = np.zeros_like(K)
+    return parratt(K, dm, np.zeros_like(dm), FA, Bt, R, clip=clip)
+
+
+def parratt_jac(K, dd, sg, SFn, FA, Bt, R):
+    # ~ d|R_N|^2 / d(dd, rh, sg) of every layer, (nL, nq) each,
+    # ~ by one backward (adjoint) sweep of a flat parratt() (no repeat blocks)
+    nL, nq = K.shape
+    R0 = R[:-1]                             # row l: interface (l -> l+1)
+    D  = 1.0/(1.0 + R0*FA[1:])
+    dR_R  = Bt[1:]*(1.0 - FA[1:]**2)*D*D    # dR[l+1]/dR[l]
+    dR_FA = Bt[1:]*(1.0 - R0**2)*D*D        # dR[l+1]/dFA[l+1]
+    dR_Bt = (R0 + FA[1:])*D                 # dR[l+1]/dBt[l+1]
+    G = np.ones((nL, nq), dtype=complex)    # dR[N]/dR[l]
+    for l in range(nL-2, -1, -1):
+        G[l] = G[l+1]*dR_R[l]
+    gFA = G[1:]*dR_FA
+    gBt = G[1:]*dR_Bt
     
+    K0 = K[:-1]
+    K1 = K[1:]
+    s2 = sg[:-1]**2
+    KK = 1.0/(K1 + K0)**2
+    F  = (K1 - K0)/(K1 + K0)
+    E  = expclip(-K1*K0*s2)
+    gK = np.zeros((nL, nq), dtype=complex)  # dR[N]/dK[l]
+    gK[1:]  += gFA*E*( 2.0*K0*KK - F*K0*s2)
+    gK[:-1] += gFA*E*(-2.0*K1*KK - F*K1*s2)
+    gK[1:]  += gBt*Bt[1:]*(-2.0*1j*np.abs(dd[1:]))
+    
+    cRN = 2.0*np.conj(R[-1])                # d|R|^2 = 2 Re(R* dR)
+    dK_rh = -2.0*np.pi*SFn/K                # K^2 = q^2/4 - 4pi(rh SFn - SLDN)
+    g_rh = np.real(cRN*gK*dK_rh)
+    g_rh[-1] = -np.real(cRN*np.sum(gK[:-1]*dK_rh[-1]*K[-1]/K[:-1], axis=0))
+    g_dd = np.zeros((nL, nq))
+    g_dd[1:] = np.real(cRN*gBt*Bt[1:]*(-2.0*1j*K1*np.sign(dd[1:])))
+    g_sg = np.zeros((nL, nq))
+    g_sg[:-1] = np.real(cRN*gFA*FA[1:]*(-2.0*K1*K0*sg[:-1]))
+    return g_dd, g_rh, g_sg
+
+
+def layer_unroll_index(nL, blk):
+    # ~ layer index of every row of the stack with the repeat blocks written out
+    first = { b[0]: b for b in blk }
+    idx = []
+    l = 0
+    while l < nL:
+        if l in first:
+            a, b, n = first[l]
+            idx += list(range(a, b+1))*n
+            l = b+1
+        else:
+            idx.append(l)
+            l = l+1
+    return idx
+
+
+def layer_blocks(LL):
+    # ~ [first, last, periods] of each repeat block (consecutive layers
+    # ~ with the same _blk id) in the layer list LL
+    blk = []
+    for l, L in enumerate(LL):
+        if L._blk == 0 or L._rep < 2:
+            continue
+        if blk and blk[-1][1] == l-1 and LL[l-1]._blk == L._blk:
+            blk[-1][1] = l
+        else:
+            blk.append([l, l, int(L._rep)])
+    for b in blk:
+        if b[0] == 0 or b[1] == len(LL)-1:
+            print('!!! repeat block cannot hold the substrate or the outer layer', b)
+    return [ b for b in blk if b[0] > 0 and b[1] < len(LL)-1 ]
+
+
+def layer_attenuation(LL, keV, tht):
+    # ~ absorption and refraction of the layers LL (compositions parsed by
+    # ~ f_comp2chem(), densities _rh) for all energies keV (nE,) and grazing
+    # ~ angles tht (ntht,) [deg] at once, from the Cromer-Liberman mu/rho and f':
+    # ~   mu    (nL, nE)        linear attenuation [1/cm], rho * sum w_atom (mu/rho)_atom
+    # ~   zpen  (nL, nE, ntht)  1/e intensity penetration depth [A], 1/(2 Im kz)
+    # ~   thtc  (nL, nE)        critical angle [deg], sqrt(2 delta)
+    # ~ delta, beta and so kz, thtc are taken relative to the outer layer LL[-1],
+    # ~ as in the reflectivity; f0 is f0(q=0), f' / mu/rho come from Cromer._fpEv
+    # ~ (or the Cromer._fpEt tables with Cromer.fp_table)
+    keV = np.atleast_1d(np.asarray(keV, dtype=float))
+    tht = np.atleast_1d(np.asarray(tht, dtype=float))
+    nL, nE = len(LL), len(keV)
+    CM = Cromer()
+    fpE = CM._fpEt if CM.fp_table else CM._fpEv
+    fp = {}
+    mu = np.zeros((nL, nE))
+    SLD = np.zeros((nL, nE))
+    for l, L in enumerate(LL):
+        if len(L.AtomS) == 0:
+            continue
+        f0 = CM._f0Qv(L.AtomS, [0.0])[:, 0]
+        for atm, AN, AM, f00 in zip(L.AtomS, L.AtomN, L.AtomM, f0):
+            atom = CM.CleanupAtomName(atm)
+            if atom not in fp:
+                fp[atom] = fpE(atom, keV)
+            mu[l] += L._rh*AN*AM/L._Mm * fp[atom][2]
+            SLD[l] += L._rh*L._re*1.0E-14*(L._Na/L._Mm) * AN*(f00 + fp[atom][0])
+    wlA = _PhysConst()._hc/keV*10.0
+    delta = wlA*wlA*SLD/(2.0*np.pi)
+    beta = mu*1.0E-8*wlA/(4.0*np.pi)
+    delta = delta - delta[-1]
+    beta = beta - beta[-1]
+    thtc = np.degrees(np.sqrt(2.0*np.clip(delta, 0, None)))
+    k = 2.0*np.pi/wlA
+    st = np.sin(np.radians(tht))
+    kz = k[:, None]*np.sqrt(st*st - 2.0*delta[..., None] + 2.0j*beta[..., None])
+    with np.errstate(divide='ignore'):
+        zpen = 1.0/(2.0*np.abs(kz.imag))
+    return mu, zpen, thtc
+
+
+def comp_attenuation(comp, rh, keV, tht):
+    # ~ layer_attenuation() of one composition ("Si;1;O;2", as in the layer
+    # ~ files) of density rh [g/cm^3] in vacuum: mu (nE,), zpen (nE, ntht), thtc (nE,)
+    mu, zpen, thtc = layer_attenuation([_XLayer('', comp, r=rh), _XLayer()], keV, tht)
+    return mu[0], zpen[0], thtc[0]
+
+
+def fit_ab(r0q4, qq4, yq4, w=None):
+    # ~ variable projection: the scale a0 and background b0 >= 0 minimizing
+    # ~ sum w (yq4 - a0 r0q4 - b0 qq4)^2, in closed form (2x2 normal equations,
+    # ~ a coefficient that comes out negative is set to 0 and the other one
+    # ~ solved alone); r0q4 : (..., nq), one solution per row, a0, b0 : (..., 1)
+    r = np.asarray(r0q4, dtype=float)
+    q = np.asarray(qq4, dtype=float)
+    y = np.asarray(yq4, dtype=float)
+    w = np.ones_like(q) if w is None else np.asarray(w, dtype=float)
+    wq = w*q
+    Srr = np.sum(w*r*r, axis=-1)
+    Srq = np.sum(wq*r, axis=-1)
+    Sqq = np.sum(wq*q)
+    Sry = np.sum(w*r*y, axis=-1)
+    Sqy = np.sum(wq*y)
+    det = Srr*Sqq - Srq*Srq
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a0 = (Sqq*Sry - Srq*Sqy) / det
+        b0 = (Srr*Sqy - Srq*Sry) / det
+        ra = Sry/Srr
+    nb = ~(b0 >= 0)     # also det = 0
+    a0 = np.where(nb, ra, a0)
+    b0 = np.where(nb, 0.0, b0)
+    na = ~(a0 >= 0)
+    a0 = np.where(na, 0.0, a0)
+    b0 = np.where(na, max(Sqy/Sqq, 0.0), b0)
+    return a0[..., None], b0[..., None]
+
+
+class _XStack:
+    # ~ array-backed layer stack: one row per layer (substrate first),
+    # ~ one column per q; the per-layer waves of _XLayer are only
+    # ~ filled in by waves() when a plot needs them
+    # ~ not re-entrant: R, FA, Bt, the dirty flags and the _XWork scratch
+    # ~ are kept from one call to the next; XRR.XS is shared only by the
+    # ~ calls of the fit path, xrr_sync(), xrr(), xrr_ab(), xrr_jac(); all
+    # ~ others (layer_waves, xrr_batch, xrr_energy, the benches) work on a
+    # ~ copy(); while XRR.fit() runs, the stack is its thread's (owner) and
+    # ~ use() asserts that no other thread touches it
+
+    def __init__(self):
+        self.nL = 0
+        self.nq = 0
+        self.qq = np.zeros(0)
+        self.dd  = np.zeros((0, 1))  # thickness A
+        self.sg  = np.zeros((0, 1))  # roughness A
+        self.rh  = np.zeros((0, 1))  # density g/cm^3
+        self.SFn = np.zeros((0, 0), dtype=complex)   # SLD / density
+        self.blk = []       # repeat blocks [first, last, periods]
+        self.blkid = []
+        self.engine = 'parratt'     # or 'abeles', 'slab'
+        self.slab = (0.5, 1.0E-3, 400)  # microslab() dz, tol, nmax
+        self.Rok = False    # all rows of R are valid, not only the top one
+        self.clip = 0       # exponents clipped in the last refl(), see expclip()
+        self.clip_batch = 0 # same, last refl_batch()
+        self.ws = _XWork()  # scratch arrays of the (nL, nq) shape
+        self.owner = None   # thread id of the fit() using the stack, see use()
+
+    def use(self):
+        assert self.owner is None or self.owner == threading.get_ident(), \
+            '_XStack: used from another thread during a fit, work on a copy()'
+
+    def layer_init(self, LL, qq):
+        # ~ (re)allocate for the layer count and q grid, take the SF of each layer
+        self.use()
+        self.alloc(len(LL), qq)
+        for l, L in enumerate(LL):
+            self.SFn[l] = L._re*1.0E-14*(L._Na/L._Mm)*L.SF
+        self.blkid = []
+        self.layer_sync(LL)
+
+    def alloc(self, nL, qq):
+        # ~ the arrays of nL layers on the q grid qq
+        nq = len(qq)
+        self.nL, self.nq = nL, nq
+        self.qq = qq
+        self.q2 = qq*qq/4.0
+        self.dd  = np.zeros((nL, 1))
+        self.sg  = np.zeros((nL, 1))
+        self.rh  = np.zeros((nL, 1))
+        self.SFn = np.zeros((nL, nq), dtype=complex)
+        self.SLD = np.zeros((nL, nq), dtype=complex)
+        self.K   = np.zeros((nL, nq), dtype=complex)
+        self.FA  = np.ones((nL, nq), dtype=complex)
+        self.Bt  = np.ones((nL, nq), dtype=complex)
+        self.R   = np.zeros((nL, nq), dtype=complex)
+        self.dirty = np.ones(nL, dtype=bool)    # layer changed since last refl()
+        self.Rok = False
+        self.ws.clear()
+
+    def copy(self):
+        # ~ a stack with arrays and scratch of its own, same layers, q grid,
+        # ~ blocks and engine; all layers dirty for its first refl()
+        XS = _XStack()
+        XS.alloc(self.nL, self.qq)
+        XS.SFn[:] = self.SFn
+        XS.dd[:], XS.sg[:], XS.rh[:] = self.dd, self.sg, self.rh
+        XS.blk, XS.blkid = list(self.blk), list(self.blkid)
+        XS.engine, XS.slab = self.engine, self.slab
+        return XS
+
+    def layer_sync(self, LL):
+        # ~ copy dd, sg, rh from the layers, mark the ones that changed
+        self.use()
+        blkid = [ (L._blk, L._rep) for L in LL ]
+        if blkid != self.blkid:
+            self.blkid = blkid
+            self.blk = layer_blocks(LL)
+            self.dirty[:] = True
+        for l, L in enumerate(LL):
+            if self.dd[l, 0] != L._dd or self.sg[l, 0] != L._sg or self.rh[l, 0] != L._rh:
+                self.dd[l] = L._dd
+                self.sg[l] = L._sg
+                self.rh[l] = L._rh
+                self.dirty[l] = True
+
+    def refl(self):
+        # ~ reflectivity intensity in the last outer layer
+        # ~ R below the lowest changed layer k is kept, interfaces k..top are redone
+        self.use()
+        if self.dirty[-1]:
+            self.dirty[:] = True    # SLD of the outer layer enters every K
+        if self.dirty.any():
+            kk = self.dirty
+            if kk.all():
+                np.multiply(self.rh, self.SFn, out=self.SLD)
+                np.subtract(self.SLD, self.SLD[-1], out=self.K)
+                self.K *= -4.0*np.pi
+                self.K += self.q2
+                np.sqrt(self.K, out=self.K)
+            else:
+                self.SLD[kk] = self.rh[kk]*self.SFn[kk]
+                self.K[kk] = np.sqrt(self.q2 - 4.0*np.pi*(self.SLD[kk] - self.SLD[-1]))
+            l0 = max(np.argmax(kk), 1)
+            for b in self.blk:
+                if b[0] <= l0 <= b[1]:
+                    l0 = b[0]       # a block is redone as a whole
+            clip = []
+            if self.engine == 'slab':
+                idx = layer_unroll_index(self.nL, self.blk)
+                self.R[-1] = microslab(self.SLD[idx], self.q2, self.dd[idx], self.sg[idx],
+                                        *self.slab, clip=clip)
+                self.Rok = False
+            elif self.engine == 'abeles':
+                self.R[-1] = abeles(self.K, self.dd, self.sg, self.FA, self.Bt, self.blk, clip, self.ws)
+                self.Rok = False
+            else:
+                if not self.Rok or self.clip:
+                    l0 = 1      # the count below l0 is only known to be 0
+                parratt(self.K, self.dd, self.sg, self.FA, self.Bt, self.R, l0, self.blk, clip, self.ws)
+                self.Rok = True
+            self.clip = sum(clip)
+            self.dirty[:] = False
+        rr = np.abs(self.R[-1], out=self.ws.get('rr', (self.nq,), float))
+        return np.square(rr, out=rr)
+
+    def refl_R(self):
+        # ~ fill in all rows of R, the abeles engine only leaves the top one
+        # ~ (the slab engine keeps its own top one, the rest is the layer model)
+        self.use()
+        if not self.Rok:
+            RN = self.R[-1].copy()
+            parratt(self.K, self.dd, self.sg, self.FA, self.Bt, self.R, 1, self.blk, ws=self.ws)
+            if self.engine == 'slab':
+                self.R[-1] = RN
+            self.Rok = True
+
+    def refl_jac(self):
+        # ~ d|R_N|^2 / d(dd, rh, sg) of every layer, (nL, nq) each; call after refl()
+        self.refl_R()
+        if not self.blk:
+            return parratt_jac(self.K, self.dd, self.sg, self.SFn, self.FA, self.Bt, self.R)
+        # ~ repeat blocks: differentiate the unrolled stack, sum over the copies
+        idx = layer_unroll_index(self.nL, self.blk)
+        K  = self.K[idx]
+        dd = self.dd[idx]
+        sg = self.sg[idx]
+        FA = np.ones_like(K)
+        Bt = np.ones_like(K)
+        R  = np.zeros_like(K)
+        parratt(K, dd, sg, FA, Bt, R)
+        gg = []
+        for gu in parratt_jac(K, dd, sg, self.SFn[idx], FA, Bt, R):
+            g = np.zeros((self.nL, self.nq))
+            np.add.at(g, idx, gu)
+            gg.append(g)
+        return gg
+
+    def refl_batch(self, dd, sg, rh, nbatch=None, dtype=complex, dSFn=None, SFn=None, q2=None):
+        # ~ dd, sg, rh : (N, nL, 1), one row per parameter candidate
+        # ~ the candidates go through parratt() in chunks of nbatch,
+        # ~ batch_size() if None
+        # ~ dtype : np.complex64 runs the pass in single precision
+        # ~ dSFn : (N, nL, 1), added to SFn for each candidate (f' + i f'' of
+        # ~ an energy scan, see XRR.xrr_energy())
+        # ~ SFn, q2 : (nL, nq), (nq,) of another q grid than the stack's
+        self.use()
+        nc = len(rh)
+        SFn = self.SFn if SFn is None else SFn
+        q2 = self.q2 if q2 is None else q2
+        nq = SFn.shape[-1]
+        nbatch = batch_size(self.nL, nq, dtype) if nbatch is None else nbatch
+        rr = np.zeros((nc, nq))
+        clip = []
+        ws = self.ws
+        if np.dtype(dtype) != SFn.dtype:
+            ft = np.finfo(dtype).dtype
+            SFn = SFn.astype(dtype)
+            q2 = q2.astype(ft)
+            dd, sg, rh = dd.astype(ft), sg.astype(ft), rh.astype(ft)
+            if dSFn is not None:
+                dSFn = dSFn.astype(dtype)
+        for c0 in range(0, nc, nbatch):
+            c1 = min(c0 + nbatch, nc)
+            shape = (c1-c0, self.nL, nq)
+            if dSFn is None:
+                SLD = np.multiply(rh[c0:c1], SFn, out=ws.get('bSLD', shape, dtype))
+            else:
+                SLD = np.add(SFn, dSFn[c0:c1], out=ws.get('bSLD', shape, dtype))
+                SLD *= rh[c0:c1]
+            K = np.subtract(SLD, SLD[:, -1:, :], out=ws.get('bK', shape, dtype))
+            K *= -4.0*np.pi
+            K += q2
+            np.sqrt(K, out=K)
+            FA = ws.get('bFA', shape, dtype)
+            Bt = ws.get('bBt', shape, dtype)
+            R  = ws.get('bR', shape, dtype)
+            if self.engine == 'slab':
+                idx = layer_unroll_index(self.nL, self.blk)
+                RN = np.array([ microslab(SLD[c, idx], q2, dd[c0+c, idx], sg[c0+c, idx],
+                                        *self.slab, clip=clip) for c in range(c1-c0) ])
+            elif self.engine == 'abeles':
+                RN = abeles(K, dd[c0:c1], sg[c0:c1], FA, Bt, self.blk, clip, ws)
+            else:
+                RN = parratt(K, dd[c0:c1], sg[c0:c1], FA, Bt, R, 1, self.blk, clip, ws)
+            np.abs(RN, out=rr[c0:c1])
+        np.square(rr, out=rr)
+        self.clip_batch = sum(clip)
+        return rr
+
+    def waves(self, LL):
+        # ~ materialize the per-layer intermediates on the _XLayer objects
+        self.use()
+        self.refl_R()
+        K0 = self.K[0]
+        sg0 = self.sg[0]
+        for l, L in enumerate(LL):
+            L.SLD = self.SLD[l].copy()
+            L.K   = self.K[l].copy()
+            if l == 0:
+                L.F   = np.ones(self.nq, dtype=complex)
+                L.Phi = np.zeros(self.nq, dtype=complex)
+                L.Atn = np.ones(self.nq, dtype=complex)
+            else:
+                L.F   = (L.K - K0)/(L.K + K0)
+                L.Phi = L.K * K0 * sg0 * sg0
+                L.Atn = expclip(-L.Phi)
+            L.FA  = self.FA[l].copy()
+            L.Bt  = self.Bt[l].copy()
+            L.R   = self.R[l].copy()
+            L.R2  = abs(L.R)**2
+            K0  = L.K
+            sg0 = self.sg[l]
+
+
+class _XObjective:
+    # ~ the DE error of XRR.fit() as a self-contained, picklable object: the q
+    # ~ grid, measured yq4, the stack arrays (SF of each layer, blocks, engine)
+    # ~ and the layer_to_fitparam() mapping, taken when it is made; XRR.LL is
+    # ~ not touched, so it can be sent to the processes of an _XPool
+
+    def __init__(self, xrr):
+        xrr.xrr_sync()
+        XS = xrr.XS
+        self.qq = XS.qq
+        self.qq4 = xrr.qq4
+        self.yq4 = xrr.yq4
+        self.a0 = xrr._a0
+        self.b0 = xrr._b0
+        self.dd = XS.dd.copy()
+        self.sg = XS.sg.copy()
+        self.rh = XS.rh.copy()
+        self.SFn = XS.SFn.copy()
+        self.blk = list(XS.blk)
+        self.engine = XS.engine
+        self.slab = XS.slab
+        self.pkey = [ (k[0], k[1]) for k in xrr.pkey ]
+        self.lin = xrr.fit_lin()    # a0, b0 by fit_ab() in each evaluation
+        self.cons = xrr.pcon        # P holds the free parameters of an _XCons
+        self.nbatch = None  # refl_batch() chunk, batch_size() if None
+        self.n = 0          # models evaluated (a jac() counts jac_cost())
+        self.clip = 0       # exponents clipped, summed over the calls
+        self.XS = None      # the _XStack, made again after unpickling
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d['XS'] = None
+        return d
+
+    def stack(self):
+        if self.XS is None:
+            XS = _XStack()
+            XS.alloc(len(self.dd), self.qq)
+            XS.SFn[:] = self.SFn
+            XS.blk = self.blk
+            XS.engine, XS.slab = self.engine, self.slab
+            self.XS = XS
+        return self.XS
+
+    def params(self, P):
+        # ~ P : (N_candidates, N_params) >> a0, b0 : (N, 1),  dd, sg, rh : (N, nL, 1)
+        # ~ as XRR.layer_from_fitparam_batch(), column by column from pkey
+        P = np.atleast_2d(P)
+        if self.cons is not None:
+            P = self.cons.expand(P)
+        nc = len(P)
+        a0 = np.full((nc, 1), self.a0)
+        b0 = np.full((nc, 1), self.b0)
+        lay = { 'dd': np.repeat(self.dd[None], nc, axis=0),
+                'sg': np.repeat(self.sg[None], nc, axis=0),
+                'rh': np.repeat(self.rh[None], nc, axis=0) }
+        for j, (key, l) in enumerate(self.pkey):
+            if key == 'a0':
+                a0 = P[:, j:j+1]
+            elif key == 'b0':
+                b0 = P[:, j:j+1]
+            else:
+                lay[key][:, l, 0] = abs(P[:, j])
+        return a0, b0, lay['dd'], lay['sg'], lay['rh']
+
+    def model(self, P, prec='double'):
+        # ~ r1q4 of each row of P, (N, nq)
+        a0, b0, dd, sg, rh = self.params(P)
+        XS = self.stack()
+        dtype = np.complex64 if prec == 'single' else complex
+        rr0 = XS.refl_batch(dd, sg, rh, self.nbatch, dtype=dtype)
+        self.clip += XS.clip_batch
+        if self.lin:
+            a0, b0 = fit_ab(self.qq4*rr0, self.qq4, self.yq4)
+        return self.qq4*(abs(a0)*rr0 + abs(b0))
+
+    def error(self, P, prec='double'):
+        # ~ rms(yq4 - r1q4) of each row of P, (N,)
+        yc = self.model(P, prec)
+        self.n += len(yc)
+        return np.sqrt(np.sum((self.yq4 - yc)**2, axis=1) / len(self.yq4))
+
+    def __call__(self, p, *args):
+        # ~ differential_evolution(): p is (N_params,), or (N_params, N) vectorized
+        err = self.error(np.asarray(p).T)
+        return err[0] if np.ndim(p) == 1 else err
+
+    def jac(self, x, hi):
+        # ~ d r1q4 / d x, (nq, N_params), analytic as XRR.xrr_jac(): one refl()
+        # ~ and refl_jac() of the stack, counted as JAC_COST models; by forward
+        # ~ differences with the slab engine (backward at the upper bounds hi),
+        # ~ its N_params+1 models in one refl_batch()
+        if self.engine != 'slab':
+            return self.jac_refl(x)
+        h = 1.5E-8*np.where(abs(x) > 0, abs(x), 1.0)
+        h = np.where(x + h > hi, -h, h)
+        Y = self.model(np.vstack([x, x + np.diag(h)]))
+        self.n += len(Y)
+        return ((Y[1:] - Y[0]) / h[:, None]).T
+
+    def jac_cost(self, nx):
+        # ~ models a jac() of nx parameters is counted as
+        return JAC_COST if self.engine != 'slab' else nx + 1
+
+    def jac_refl(self, x):
+        P = x if self.cons is None else self.cons.expand(x)
+        a0, b0, dd, sg, rh = self.params(x)
+        XS = self.stack()
+        XS.dd[:], XS.sg[:], XS.rh[:] = dd[0], sg[0], rh[0]
+        XS.dirty[:] = True
+        r0q4 = self.qq4*XS.refl()
+        self.n += JAC_COST
+        if self.lin:
+            a0, b0 = fit_ab(r0q4, self.qq4, self.yq4)
+        a0, b0 = float(np.ravel(a0)[0]), float(np.ravel(b0)[0])
+        g = dict(zip(('dd', 'rh', 'sg'), XS.refl_jac()))
+        aq4 = abs(a0)*self.qq4
+        J = []
+        for j, (key, l) in enumerate(self.pkey):
+            if key == 'a0':
+                J.append( np.sign(P[j])*r0q4 )
+            elif key == 'b0':
+                J.append( np.sign(P[j])*self.qq4 )
+            else:
+                J.append( np.sign(P[j])*aq4*g[key][l] )
+        J = np.array(J).T
+        if self.lin:
+            F = np.array([ f for f, c in ((r0q4, a0), (self.qq4, b0)) if c > 0 ]).T
+            if F.size:
+                J = J - F @ np.linalg.lstsq(F, J, rcond=None)[0]
+        return J if self.cons is None else J @ self.cons.jac(x)
+
+    def local(self, x0, lo, hi, xs, nmax=None):
+        # ~ bounded trust-region fit (least_squares trf) from x0, residuals
+        # ~ relative to the rms of yq4 as fitmode 2, the Jacobian by jac()
+        # ~ nmax : models evaluated at most, a residual costs 1, a Jacobian
+        # ~ jac_cost() and trf takes at most one Jacobian per residual
+        # ~ returns x, rms(yq4 - r1q4), the least_squares status
+        ys = np.sqrt(np.mean(self.yq4**2))
+        max_nfev = None if nmax is None else max(1, nmax // (1 + self.jac_cost(len(x0))))
+        def fun(x):
+            self.n += 1
+            return (self.model(x)[0] - self.yq4)/ys
+        def jac(x):
+            return self.jac(x, hi)/ys
+        res = scipy.optimize.least_squares(fun, x0, jac=jac, bounds=(lo, hi),
+            x_scale=xs, method='trf', max_nfev=max_nfev)
+        return res.x, np.sqrt(np.mean(res.fun**2))*ys, res.status
+
+
+_XOBJ = None    # the _XObjective of a pool process
+
+
+def _xobj_init(obj):
+    global _XOBJ
+    _XOBJ = obj
+
+
+def _xobj_error(P, prec):
+    n, clip = _XOBJ.n, _XOBJ.clip
+    err = _XOBJ.error(P, prec)
+    return err, _XOBJ.n - n, _XOBJ.clip - clip
+
+
+def _xobj_local(x0, lo, hi, xs, nmax):
+    n, clip = _XOBJ.n, _XOBJ.clip
+    res = _XOBJ.local(x0, lo, hi, xs, nmax)
+    return res, _XOBJ.n - n, _XOBJ.clip - clip
+
+
+class _XPool:
+    # ~ _XObjective.error() of a candidate matrix split over nproc processes
+    # ~ (all cores if None); the objective is sent once to each process, the
+    # ~ evaluation and clip counters come back into the parent's objective
+
+    def __init__(self, obj, nproc=None):
+        from concurrent.futures import ProcessPoolExecutor
+        self.obj = obj
+        self.nproc = nproc or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(self.nproc, initializer=_xobj_init, initargs=(obj,))
+
+    def error(self, P, prec='double'):
+        P = np.atleast_2d(P)
+        chunks = np.array_split(P, min(self.nproc, len(P)))
+        res = list(self.pool.map(_xobj_error, chunks, [prec]*len(chunks)))
+        self.obj.n += sum(r[1] for r in res)
+        self.obj.clip += sum(r[2] for r in res)
+        return np.concatenate([ r[0] for r in res ])
+
+    def local(self, X0, lo, hi, xs, nmax=None, done=None):
+        # ~ _XObjective.local() from each row of X0, one start per task, in
+        # ~ the order they finish; done(result) after each, True cancels the
+        # ~ starts not yet running
+        from concurrent.futures import as_completed
+        tasks = [ self.pool.submit(_xobj_local, x0, lo, hi, xs, nmax) for x0 in X0 ]
+        res = []
+        for t in as_completed(tasks):
+            if t.cancelled():
+                continue
+            r, n, clip = t.result()
+            self.obj.n += n
+            self.obj.clip += clip
+            res.append(r)
+            if done is not None and done(r):
+                for t in tasks:
+                    t.cancel()
+        return res
+
+    def close(self):
+        self.pool.shutdown()
+
+
+class _XCons:
+    # ~ the constraints XRR.fitcons on the layer_to_fitparam() vector, by the
+    # ~ parameter names of pkey:
+    # ~     'rh[4]': 2.2            fixed
+    # ~     'rh[4]': 'rh[1]'        tied: an expression of the other parameters,
+    # ~     'dd[5]': '2*dd[3]'      a0, b0, dd[l], rh[l], sg[l] of any layer, np,
+    # ~                             evaluated in the fitcons order
+    # ~     'sg[2]': (0.0, 8.0)     bounds, the parameter stays free
+    # ~ the optimizer only sees the free parameters x, expand(x) gives the
+    # ~ full vector; plain data and strings, so it pickles with _XObjective
+
+    env = {'__builtins__': {}, 'np': np, 'abs': abs}   # globals of the expressions
+
+    def __init__(self, pkey, pfit, LL, a0, b0, fitcons):
+        self.pkey = [ (k[0], k[1]) for k in pkey ]
+        self.names = [ k[2] for k in pkey ]
+        self.p0 = np.array(pfit, dtype=float)
+        self.base = { 'dd': np.array([ L._dd for L in LL ]),
+                      'rh': np.array([ L._rh for L in LL ]),
+                      'sg': np.array([ L._sg for L in LL ]),
+                      'a0': a0, 'b0': b0 }
+        self.fixed, self.expr, self.bounds = {}, {}, {}
+        for name, c in fitcons.items():
+            name = blank_strip(name)
+            if name in ('a0', 'b0'):
+                name = name + '[-1]'
+            if name not in self.names:
+                print('!!! fitcons:', name, 'is not a fit parameter')
+                continue
+            i = self.names.index(name)
+            if isinstance(c, str):
+                self.expr[i] = c
+            elif np.ndim(c) == 0:
+                self.fixed[i] = float(c)
+            else:
+                self.bounds[i] = (float(c[0]), float(c[1]))
+        ns = self.space(self.p0)
+        for i, e in list(self.expr.items()):
+            try:
+                float(eval(e, self.env, ns))
+            except Exception as err:
+                print('!!! fitcons:', self.names[i], '=', e, ':', err)
+                del self.expr[i]
+        self.free = [ i for i in range(len(self.names)) if i not in self.fixed and i not in self.expr ]
+
+    def space(self, P):
+        # ~ the names of the expressions: dd, rh, sg of all layers and a0, b0,
+        # ~ from the full vector(s) P, one value per row
+        shape = np.shape(P)[:-1]
+        ns = {}
+        for k, v in self.base.items():
+            v = np.reshape(v, np.shape(v) + (1,)*len(shape))
+            ns[k] = np.array(np.broadcast_to(v, v.shape[:np.ndim(v)-len(shape)] + shape), dtype=float)
+        for j, (key, l) in enumerate(self.pkey):
+            self.set(ns, key, l, P[..., j])
+        return ns
+
+    @staticmethod
+    def set(ns, key, l, v):
+        if l < 0:
+            ns[key] = v
+        else:
+            ns[key][l] = v
+
+    def reduce(self, P):
+        # ~ the free parameters of the full vector(s) P
+        return np.asarray(P, dtype=float)[..., self.free]
+
+    def expand(self, x):
+        # ~ x : (..., N_free) >> (..., N_params)
+        x = np.asarray(x, dtype=float)
+        P = np.empty(x.shape[:-1] + self.p0.shape)
+        P[...] = self.p0
+        P[..., self.free] = x
+        for i, v in self.fixed.items():
+            P[..., i] = v
+        if self.expr:
+            ns = self.space(P)
+            for i, e in self.expr.items():
+                P[..., i] = eval(e, self.env, ns)
+                self.set(ns, *self.pkey[i], P[..., i])
+        return P
+
+    def jac(self, x):
+        # ~ d expand(x) / dx : (N_params, N_free), the expressions by central
+        # ~ differences (no model evaluation), so J_free = J_full @ jac(x)
+        x = np.asarray(x, dtype=float)
+        m = len(x)
+        M = np.zeros((len(self.p0), m))
+        M[self.free, np.arange(m)] = 1.0
+        if self.expr:
+            h = 1.0E-6*np.maximum(abs(x), 1.0E-3)
+            E = np.eye(m)*h
+            D = (self.expand(x + E) - self.expand(x - E)) / (2.0*h[:, None])
+            ie = list(self.expr)
+            M[ie] = D[:, ie].T
+        return M
+
+    def names_free(self):
+        return [ self.names[i] for i in self.free ]
+
+
 ########################################################################
 ########################################################################
 ########################################################################
@@ -189,6 +1125,15 @@ class XRR():
     _keV = _PhysConst().wlA2keV(_wl_A)
     
     LL = [] # layer array
+    XS = None   # array-backed layer stack
+    engine = 'parratt'  # or 'abeles' (transfer matrices), same result,
+                        # or 'slab' (erf profile in microslabs, no Nevot-Croce)
+    slab = (0.5, 1.0E-3, 400)   # slab engine: dz A, SLD tol (rel.), max slabs
+    clipped = 0         # exponents clipped in the last xrr() / xrr_batch()
+    prec = 'double'     # or 'single': complex64 xrr_batch() (DE), see fit()
+    prec_tol = 1.0E-3   # DE goes single -> double when the best error improves less
+    prec_dev = 0.0      # max rel. deviation of r1q4, single vs double, best candidate
+    nproc = 1           # DE processes, None: all cores, see _XPool
     
     mx = []     # measured data
     my = []
@@ -207,11 +1152,22 @@ class XRR():
     fitn = 0
     fiterr = 0
     fitkeys = [ 'ab', 'dd', 'rh', 'sg']
-    fitmode = 0
+    fitmode = 0     # 0: L-M (curve_fit), 1: D-E, 2: bounded trust-region (least_squares)
+    fitjac = True   # L-M, T-R: analytic Jacobian (not with the slab engine)
+    fitrh = 1.1     # T-R: density bound rh <= fitrh * bulk (_rhb > 0 only, layer file column 6)
+    fitbox = 0.25   # D-E, multi-start: search box p*(1 -/+ fitbox) around the parameters
+    fitstart = 16   # multi-start: starting points, see fit_multistart()
+    fittol = 1.0E-2 # multi-start: minima with chi2 within fittol (relative) are the same
+    fitsols = []    # multi-start: the distinct minima, best first
+    fitlin = False  # with 'ab' in fitkeys: a0, b0 solved linearly in each
+                    # evaluation (fit_ab), not fitted, see fit_keys()
+    fitcons = {}    # constraints on the fit parameters, see _XCons
+    pcon = None     # the _XCons of the last fit()
     abort = 0
     fitmax = 100
     
     popt = []
+    pnames = [] # parameter names of popt, perr
     pcov = []
     perr = []
     ferr = []
@@ -223,6 +1179,15 @@ class XRR():
         where("", self.whrn)
         self.fitkeys = [ 'ab', 'dd', 'rh', 'sg']
         self.fitmode = 0
+        self.fitjac = True
+        self.fitrh = 1.1
+        self.fitbox = 0.25
+        self.fitstart = 16
+        self.fittol = 1.0E-2
+        self.fitsols = []
+        self.fitlin = False
+        self.fitcons = {}
+        self.pcon = None
         self.fitmax = 100
         self.abort = 0
         self.fitn = 0
@@ -233,6 +1198,14 @@ class XRR():
         self._b0 = self._b0_m*10.0**self._b0_e
         
         self._keV = _PhysConst().wlA2keV(self._wl_A)
+        self.XS = _XStack()
+        self.engine = 'parratt'
+        self.slab = (0.5, 1.0E-3, 400)
+        self.clipped = 0
+        self.prec = 'double'
+        self.prec_tol = 1.0E-3
+        self.prec_dev = 0.0
+        self.nproc = 1
         
         self.xrr_str()
         # ~ self.data_load('xrr_test.dat')
@@ -259,13 +1232,22 @@ class XRR():
     
     def layer_save(self, fname): 
         fileh = open(fname,"w")
-        header = '# name , chem_comp , thickness_[A] , roughness_[A] , density_[g/cm^3] \n'
+        header = '# name , chem_comp , thickness_[A] , roughness_[A] , density_[g/cm^3] [, bulk_density_[g/cm^3]] \n'
         fileh.write(header)
         # ~ print(header)
+        blk = 0
         for L in self.LL:
-            line = L._name + ' , ' + L._comp + ' , ' + str(L._dd) + ' , ' + str(L._sg) + ' , ' + str(L._rh) + ' \n' 
+            if L._blk != blk:
+                if blk:     fileh.write('end \n')
+                if L._blk:  fileh.write('repeat , ' + str(L._rep) + ' \n')
+                blk = L._blk
+            line = L._name + ' , ' + L._comp + ' , ' + str(L._dd) + ' , ' + str(L._sg) + ' , ' + str(L._rh)
+            if L._rhb > 0:
+                line += ' , ' + str(L._rhb)
+            line += ' \n' 
             fileh.write(line)
             # ~ print(line)
+        if blk:     fileh.write('end \n')
         fileh.close()
         
         
@@ -281,21 +1263,46 @@ class XRR():
     def layer_parse(self):
         where("", self.whrn)
         self.LL = []
+        nblk, blk, rep = 0, 0, 1
         for line in self.layer.splitlines():
             if line[0] != '#' :
                 # ~ print(line)
-                [name, comp, s_dd, s_sg, s_rh] = line.split(',')
-                self.layer_add(_XLayer(name,  comp, d=float(s_dd),  s=float(s_sg), r=float(s_rh) ))
+                item = line.split(',')
+                key = blank_strip(item[0]).lower()
+                if key == 'repeat':     # ~ "repeat , N" ... "end" : block of N periods
+                    nblk = nblk + 1
+                    blk, rep = nblk, int(item[1])
+                    continue
+                if key == 'end':
+                    blk, rep = 0, 1
+                    continue
+                # ~ the 6th column, the bulk density, is optional (fit_bounds())
+                [name, comp, s_dd, s_sg, s_rh] = item[:5]
+                s_rb = item[5] if len(item) > 5 and item[5].strip() else '0'
+                L = _XLayer(name,  comp, d=float(s_dd),  s=float(s_sg), r=float(s_rh), rb=float(s_rb) )
+                L._blk, L._rep = blk, rep
+                self.layer_add(L)
         return
     
     def layer_print(self):
         print( _XLayer().__line__() )
         print( _XLayer().__header__() )
         print( _XLayer().__line__() )
+        blk = 0
         for  L in self.LL: 
+            if L._blk != blk:
+                if blk:     print( 'end' )
+                if L._blk:  print( f'repeat x {L._rep}' )
+                blk = L._blk
             print( L )
+        if blk:     print( 'end' )
         print( _XLayer().__line__() )
         
+    def layer_unroll(self):
+        # ~ self.LL with the repeat blocks written out (the same _XLayer objects)
+        idx = layer_unroll_index(len(self.LL), layer_blocks(self.LL))
+        return [ self.LL[i] for i in idx ]
+        
     
     def layer_init(self):
         where("", self.whrn)
@@ -304,6 +1311,7 @@ class XRR():
             L.f_qwaves(self.qq)
             L.f_SF(self.qq, self._keV)
             L.f_SLD()
+        self.XS.layer_init(self.LL, self.qq)
         
         
     def data_load(self, fname):
@@ -417,6 +1425,7 @@ class XRR():
     def plot2(self, ax2, ax, ay, drag):
         ax2.plot(self.qq, self.yq4, label='meas.', c='g', linewidth=1.5)
         ax2.plot(self.qq, self.r1q4, label='calc.', c='r', linewidth=1.5)
+        self.layer_waves()
         for L in self.LL:
             ax2.plot(self.qq, abs(L.R2*L.Q**4), label=L._name, linewidth=0.75)
         ax2.legend(loc=2, bbox_to_anchor=(ax, ay), ncol=1, fontsize=8, title=r'$R^2Q^4$').draggable(drag)  
@@ -445,6 +1454,158 @@ class XRR():
         ax4.set_xlabel(r'$z \ [\AA]$')
 
        
+    def fit_lin(self):
+        # ~ a0, b0 are solved by fit_ab() instead of fitted
+        return self.fitlin and 'ab' in self.fitkeys
+
+    def fit_keys(self):
+        # ~ the fitkeys of the parameter vector, 'ab' left out with fit_lin()
+        return [ key for key in self.fitkeys if not (key == 'ab' and self.fit_lin()) ]
+
+    def fit_bounds(self):
+        # ~ the bounds of the layer_to_fitparam() vector: a0, b0, dd, sg, rh >= 0;
+        # ~ rh has no upper bound unless the layer file gives a bulk density
+        # ~ _rhb for the layer (rh <= fitrh * _rhb, fitrh None: none either):
+        # ~ the density column is a starting value, not the bulk of the
+        # ~ material, and there are no bulk density tables here
+        lo = np.zeros(len(self.pkey))
+        hi = np.full(len(self.pkey), np.inf)
+        for j, (key, l, name) in enumerate(self.pkey):
+            if key == 'rh' and self.LL[l]._rhb > 0 and self.fitrh is not None:
+                hi[j] = self.fitrh*self.LL[l]._rhb
+        return lo, hi
+
+    def fit_bounds_free(self, bnds):
+        # ~ fit_bounds() of the free parameters, the fitcons bounds bnds first
+        lo, hi = self.fit_bounds()
+        if self.pcon is not None:
+            lo, hi = self.pcon.reduce(lo), self.pcon.reduce(hi)
+        for j, (a, b) in bnds.items():
+            lo[j], hi[j] = a, b
+        return lo, hi
+
+    def fit_pcov(self, J, ssr):
+        # ~ covariance as curve_fit, from the Jacobian J (nq, N) of the
+        # ~ residuals at the solution and their sum of squares ssr
+        _, sv, VT = np.linalg.svd(J, full_matrices=False)
+        keep = sv > np.finfo(float).eps*max(J.shape)*sv[0]
+        sv, VT = sv[keep], VT[keep]
+        pcov = (VT.T / sv**2) @ VT
+        dof = len(self.yq4) - J.shape[1]
+        return pcov*(ssr/dof) if dof > 0 else np.full_like(pcov, np.inf)
+
+    def fit_setup(self):
+        # ~ layer_to_fitparam() and the _XCons of fitcons: the free parameters,
+        # ~ their names and the fitcons bounds { free index: (lo, hi) }
+        self.layer_to_fitparam()
+        self.pcon = None
+        pfit, pnames = self.pfit, [ k[2] for k in self.pkey ]
+        if self.fitcons:
+            self.pcon = _XCons(self.pkey, self.pfit, self.LL, self._a0, self._b0, self.fitcons)
+            pfit, pnames = list(self.pcon.reduce(self.pfit)), self.pcon.names_free()
+            print('fit constraints: %d of %d parameters free' % (len(pfit), len(self.pfit)))
+        bnds = {} if self.pcon is None else { self.pcon.free.index(i): b
+                                              for i, b in self.pcon.bounds.items() }
+        return pfit, pnames, bnds
+
+    def fit_multistart(self, nstart=None, seed=None):
+        # ~ multi-start fit: nstart (fitstart) points of a Latin hypercube over
+        # ~ the box p*(1 -/+ fitbox) of the free parameters (within the bounds
+        # ~ of fitmode 2), the current parameters first; a bounded trust-region
+        # ~ fit from each (_XObjective.local, in the processes of an _XPool with
+        # ~ nproc != 1 on more than one core: a start is too short for a pool
+        # ~ to pay on one); a start ends after fitmax (100*(N_free+1) if 0)
+        # ~ model evaluations, those that do not converge are left out, abort
+        # ~ stops the starts not yet run
+        # ~ the converged points with chi2 within fittol (relative) of each
+        # ~ other are one minimum: the data do not tell them apart, whereas
+        # ~ their parameters can differ far along a flat valley (by 'dx')
+        # ~ returns self.fitsols, the distinct minima best first:
+        # ~   { 'x': free parameters, 'p': layer_to_fitparam() vector,
+        # ~     'err': rms(yq4 - r1q4), 'chi2': sum(yq4 - r1q4)^2/(nq - N_free),
+        # ~     'n': starts that ended there, 'dx': max |x_start - x| of these }
+        # ~ and leaves the layers at the best one, pcov, perr there; if no
+        # ~ start converged [] and the layers as they were
+        from scipy.stats import qmc
+        nstart = self.fitstart if nstart is None else nstart
+        pfit, pnames, bnds = self.fit_setup()
+        lo, hi = self.fit_bounds_free(bnds)
+        p0 = np.clip(pfit, lo, hi)
+        xs = np.where(abs(p0) > 0, abs(p0), 1.0)
+        blo = np.clip(np.minimum(p0*(1-self.fitbox), p0*(1+self.fitbox)), lo, hi)
+        bhi = np.clip(np.maximum(p0*(1-self.fitbox), p0*(1+self.fitbox)), lo, hi)
+        X0 = blo + qmc.LatinHypercube(d=len(p0), seed=seed).random(max(nstart-1, 0))*(bhi - blo)
+        X0 = np.vstack([p0, X0])
+        nmax = self.fitmax if self.fitmax else 100*(len(p0) + 1)
+        ncpu = os.cpu_count() or 1
+        nproc = min(self.nproc or ncpu, ncpu, len(X0))
+
+        fobj = _XObjective(self)
+        fitn = self.fitn
+        self.ferr = list(self.ferr)
+        errs = []
+        def done(r):
+            # ~ after each start: progress, and True to stop on abort
+            errs.append(r[1])
+            self.ferr.append(r[1])
+            self.fitn = fitn + fobj.n
+            self.fiterr = min(errs)
+            self.post_event(key=1, msg='fitting')
+            if self.abort:
+                self.post_event(key=-1, msg='aborting')
+            return bool(self.abort)
+
+        if nproc > 1:
+            pool = _XPool(fobj, nproc)
+            try:
+                res = pool.local(X0, lo, hi, xs, nmax, done)
+            finally:
+                pool.close()
+        else:
+            res = []
+            for x0 in X0:
+                res.append(fobj.local(x0, lo, hi, xs, nmax))
+                if done(res[-1]):
+                    break
+
+        dof = max(len(self.yq4) - len(p0), 1)
+        sols = []
+        nrun = len(res)
+        res = sorted([ r for r in res if r[2] > 0 ], key=lambda r: r[1])
+        for x, err, status in res:
+            chi2 = err*err*len(self.yq4)/dof
+            for sol in sols:
+                if chi2 - sol['chi2'] <= self.fittol*sol['chi2']:
+                    sol['n'] += 1
+                    sol['dx'] = np.maximum(sol['dx'], abs(x - sol['x']))
+                    break
+            else:
+                p = x if self.pcon is None else self.pcon.expand(x)
+                sols.append({ 'x': x, 'p': p, 'err': err, 'chi2': chi2, 'n': 1,
+                              'dx': np.zeros_like(x) })
+        print('multi-start: %d of %d starts run, %d not converged, %d distinct minima' %
+              (nrun, len(X0), nrun - len(res), len(sols)))
+        for sol in sols:
+            print('\t chi2 = %.4e  err = %.4e  x %d' % (sol['chi2'], sol['err'], sol['n']))
+        self.fitsols = sols
+        self.pnames = pnames
+        if not sols:
+            print('!!! multi-start: no start converged, the layers are left as they were')
+            self.popt, self.pcov, self.perr = np.array(pfit), [], []
+            return sols
+        self.popt = sols[0]['x']
+        self.fiterr = sols[0]['err']
+        # ~ covariance as fitmode 2, from the Jacobian at the best minimum
+        J = fobj.jac(self.popt, hi)
+        self.fitn = fitn + fobj.n
+        self.pcov = self.fit_pcov(J, self.fiterr**2*len(self.yq4))
+        self.perr = np.sqrt(np.diag(self.pcov))
+        self.layer_from_fitparam(sols[0]['p'])
+        self.xrr()
+        if self.fit_lin():
+            self.xrr_ab()
+        return sols
+
     def layer_to_fitparam(self):
         where("", self.whrn)
         self.pfit = []
@@ -452,7 +1613,7 @@ class XRR():
         def keyadd( key, idx): 
             self.pkey.append( [ key, idx, key+'['+str(idx)+']' ] )
         
-        for key in self.fitkeys:
+        for key in self.fit_keys():
             if key == 'ab':
                 self.pfit.append(self._a0)
                 self.pfit.append(self._b0)
@@ -484,7 +1645,7 @@ class XRR():
     def layer_from_fitparam(self, pw):
         # ~ where(f"{self.fitn}", 3)
         N=0
-        for key in self.fitkeys:
+        for key in self.fit_keys():
             if key == 'ab':
                 self._a0 = pw[N+0]    
                 self._b0 = pw[N+1]
@@ -511,6 +1672,137 @@ class XRR():
                 
                 
                 
+    def layer_from_fitparam_batch(self, P, XS=None):
+        # ~ P : (N_candidates, N_params) >> a0, b0 : (N, 1),  dd, sg, rh : (N, nL, 1)
+        # ~ same mapping as layer_from_fitparam(), self.LL is not touched;
+        # ~ the layers not in P from the stack XS (self.XS if None)
+        XS = self.XS if XS is None else XS
+        P = np.atleast_2d(P)
+        nc = len(P)
+        nL = len(self.LL)
+        a0 = np.full((nc, 1), self._a0)
+        b0 = np.full((nc, 1), self._b0)
+        dd = np.repeat(XS.dd[None], nc, axis=0)
+        sg = np.repeat(XS.sg[None], nc, axis=0)
+        rh = np.repeat(XS.rh[None], nc, axis=0)
+        N=0
+        for key in self.fit_keys():
+            if key == 'ab':
+                a0 = P[:, N+0:N+1]
+                b0 = P[:, N+1:N+2]
+                N = N+2
+            if key == 'dd':
+                dd[:, 1:-1, 0] = abs(P[:, N:N+nL-2])
+                N = N + nL-2
+            if key == 'rh':
+                rh[:, :-1, 0] = abs(P[:, N:N+nL-1])
+                N = N + nL-1
+            if key == 'sg':
+                sg[:, :-1, 0] = abs(P[:, N:N+nL-1])
+                N = N + nL-1
+        return a0, b0, dd, sg, rh
+        
+    def xrr_batch(self, P, prec=None):
+        # ~ r1q4 for each row of P (N_candidates x N_params) in one Parratt pass
+        # ~ prec : 'single' (complex64) or 'double', self.prec if None
+        XS = self.xrr_copy()
+        prec = self.prec if prec is None else prec
+        a0, b0, dd, sg, rh = self.layer_from_fitparam_batch(P, XS)
+        dtype = np.complex64 if prec == 'single' else complex
+        rr0 = XS.refl_batch(dd, sg, rh, dtype=dtype)
+        self.clipped = XS.clip_batch
+        if self.fit_lin():
+            a0, b0 = fit_ab(self.qq4*rr0, self.qq4, self.yq4)
+        return self.qq4*(abs(a0)*rr0 + abs(b0))
+                
+    def xrr_energy(self, keV, qq=None, nbatch=None):
+        # ~ anomalous XRR: r1q4 on the (energy, q) grid, (len(keV), nq), for the
+        # ~ current layers; qq : q grid (A^-1), self.qq if None
+        # ~ f0(q) is energy independent and taken once per layer, f' + i f'' of
+        # ~ each element comes from one vectorized call over all energies
+        # ~ (Cromer._fpEv, or the tables of Cromer._fpEt with Cromer.fp_table),
+        # ~ and the energies go through refl_batch() as candidates
+        XS = self.xrr_copy()
+        keV = np.atleast_1d(np.asarray(keV, dtype=float))
+        qq = self.qq if qq is None else np.asarray(qq, dtype=float)
+        nE, nL, nq = len(keV), len(self.LL), len(qq)
+        CM = Cromer()
+        fpE = CM._fpEt if CM.fp_table else CM._fpEv
+        fp = {}
+        SFn = np.zeros((nL, nq), dtype=complex)
+        dSFn = np.zeros((nE, nL, 1), dtype=complex)
+        for l, L in enumerate(self.LL):
+            cl = L._re*1.0E-14*(L._Na/L._Mm)
+            SF = np.array(qq, dtype=complex)    # ~ as in f_qwaves() / f_SF()
+            if len(L.AtomS):
+                SF += L.AtomN @ CM._f0Qv(L.AtomS, qq)
+                for atm, AN in zip(L.AtomS, L.AtomN):
+                    if atm not in fp:
+                        f = fpE(atm, keV)
+                        fp[atm] = f[0] + 1j*f[1]
+                    dSFn[:, l, 0] += AN*fp[atm]
+            SFn[l] = cl*SF
+            dSFn[:, l, 0] *= cl
+        shape = (nE, nL, 1)
+        dd = np.broadcast_to(XS.dd, shape)
+        sg = np.broadcast_to(XS.sg, shape)
+        rh = np.broadcast_to(XS.rh, shape)
+        rr0 = XS.refl_batch(dd, sg, rh, nbatch, dSFn=dSFn, SFn=SFn, q2=qq*qq/4.0)
+        self.clipped = XS.clip_batch
+        return qq**4*(abs(self._a0)*rr0 + abs(self._b0))
+
+    def xrr_attenuation(self, keV=None, tht=None):
+        # ~ layer_attenuation() of the current layers, at self._keV and the
+        # ~ angles of the data (xx = 2 theta) by default
+        keV = self._keV if keV is None else keV
+        tht = self.xx/2.0 if tht is None else tht
+        return layer_attenuation(self.LL, keV, tht)
+
+    def xrr_jac(self, pw):
+        # ~ analytic d(r1q4)/d(pw) : (nq, N_params), columns in layer_to_fitparam() order
+        # ~ with fit_lin(), a0, b0 = fit_ab() and the Kaufman Jacobian of the
+        # ~ projected problem: the columns projected out of span(r0q4, qq4)
+        self.layer_from_fitparam(pw)
+        self.xrr()
+        if self.fit_lin():
+            self.xrr_ab()
+        g_dd, g_rh, g_sg = self.XS.refl_jac()
+        aq4 = abs(self._a0)*self.qq4
+        nL = len(self.LL)
+        J = []
+        N = 0
+        for key in self.fit_keys():
+            if key == 'ab':
+                J.append( np.sign(pw[N+0])*self.r0q4 )
+                J.append( np.sign(pw[N+1])*self.qq4 )
+                N = N+2
+            if key == 'dd':
+                for l in range(1, nL-1):
+                    J.append( np.sign(pw[N])*aq4*g_dd[l] )
+                    N = N+1
+            if key == 'rh':
+                for l in range(0, nL-1):
+                    J.append( np.sign(pw[N])*aq4*g_rh[l] )
+                    N = N+1
+            if key == 'sg':
+                for l in range(0, nL-1):
+                    J.append( np.sign(pw[N])*aq4*g_sg[l] )
+                    N = N+1
+        J = np.array(J).T
+        if self.fit_lin():
+            F = np.array([ f for f, c in ((self.r0q4, self._a0), (self.qq4, self._b0)) if c > 0 ]).T
+            if F.size:
+                J = J - F @ np.linalg.lstsq(F, J, rcond=None)[0]
+        return J
+
+    def xrr_ab(self):
+        # ~ a0, b0 of the last xrr() from fit_ab(), rr1 and r1q4 redone
+        a0, b0 = fit_ab(self.r0q4, self.qq4, self.yq4)
+        self._a0, self._b0 = float(a0[0]), float(b0[0])
+        self.rr1 = self._a0*self.rr0 + self._b0
+        self.r1q4 = self.qq4*self.rr1
+        return self.r1q4
+                
     def set_fitkeys(self, fitkeys=[ 'ab', 'dd', 'rh', 'sg']):
     #===================================================
         self.fitkeys = fitkeys
@@ -539,6 +1831,15 @@ class XRR():
     
 
     def fit(self):
+    #========================
+        # ~ the stack XS is this thread's until the fit ends (_XStack.use())
+        self.XS.owner = threading.get_ident()
+        try:
+            self.fit_run()
+        finally:
+            self.XS.owner = None
+
+    def fit_run(self):
     #========================
         where("", self.whrn)
         # ~ print('\t XRR.fit()')
@@ -546,18 +1847,28 @@ class XRR():
         # ~ def zero(): self.r1q4[:] = 0.1
         def zero(): self.r1q4 = self.yq4
         #============================
+        def full(pw):
+        #===================
+            # ~ the layer_to_fitparam() vector of the free parameters pw
+            return pw if self.pcon is None else self.pcon.expand(pw)
+        #def_end
+
         def xrrp(qq, *pw):
         #===================
             # ~ qq=4*pi*sin(tht)/wl
             # ~ pw=fit parameter wave
                 
-            self.layer_from_fitparam(pw)    
+            self.layer_from_fitparam(full(pw))    
             self.r1q4 = self.xrr()  
+            if self.fit_lin():
+                self.xrr_ab()
             self.fitn = self.fitn + 1
             yc = self.r1q4
             ym = self.yq4
             self.fiterr = np.sqrt(sum((ym - yc)**2) / len(ym))
             self.ferr.append(self.fiterr)
+            if self.fiterr < best[0]:
+                best[:] = [self.fiterr, np.array(pw)]
             print(".", end='', flush=True)
         
             if not (self.fitn % update ):
@@ -575,14 +1886,23 @@ class XRR():
             return self.r1q4 
         #def_end
 
+        def xrrj(qq, *pw):
+        #===================
+            # ~ analytic Jacobian of xrrp, chained through the constraints
+            J = self.xrr_jac(full(pw))
+            return J if self.pcon is None else J @ self.pcon.jac(pw)
+        #def_end
+
         def xrrd(p, *data):
         #===================
             if not (self.fitn % update):
                 self.post_event(key=1,  msg='fitting')
             self.fitn =self.fitn +1
             x, y = data
-            self.layer_from_fitparam(p)
+            self.layer_from_fitparam(full(p))
             self.xrr()   # >> xrr.r1q4 
+            if self.fit_lin():
+                self.xrr_ab()
             yc = self.r1q4
             ym = self.yq4
             self.fiterr = np.sqrt(sum((ym - yc)**2) / len(ym))
@@ -590,6 +1910,36 @@ class XRR():
             return self.fiterr
         #def_end
         
+        def xrrv(pp, *data):
+        #===================
+            # ~ vectorized: pp is (N_params, N_candidates), one error per candidate
+            # ~ the candidates go to the _XObjective, in the processes of
+            # ~ the pool with nproc != 1
+            if np.ndim(pp) == 1:
+                return xrrd(pp, *data)
+            n, clip = fobj.n, fobj.clip
+            err = (pool or fobj).error(pp.T, self.fitprec)
+            if self.fitprec == 'single':
+                # ~ check the best candidate in double, stay single while it pays
+                i = np.argmin(err)
+                y64 = fobj.model(pp.T[i:i+1], 'double')[0]
+                yc = fobj.model(pp.T[i:i+1], 'single')
+                self.prec_dev = np.max(abs(yc[0] - y64)/abs(y64))
+                ebest = min(err[i], self.fitbest)
+                if self.fitbest - ebest < self.prec_tol*self.fitbest:
+                    self.fitprec = 'double'
+                    print('\n single -> double precision, max rel. dev. %.2e' % self.prec_dev)
+                self.fitbest = ebest
+            n = fobj.n - n
+            if (self.fitn // update) != ((self.fitn + n) // update):
+                self.post_event(key=1,  msg='fitting')
+            self.fitn = self.fitn + n
+            self.clipped = fobj.clip - clip
+            self.fiterr = err.min()
+            self.ferr.extend(err)
+            return err
+        #def_end
+        
         class Callback(object):
             def __init__(self):
                 self.nit = 0
@@ -603,22 +1953,43 @@ class XRR():
         self.nit = 0
         self.abort = 0
         self.ferr = []
+        best = [np.inf, None]   # L-M: lowest fiterr of xrrp() and its parameters
         update = 20
         maxiter = 5
         
         # ~ self.layer_print()
-        self.layer_to_fitparam()
+        pfit, pnames, bnds = self.fit_setup()
             
         if self.fitmode is 0:
         #====================
             
             print('fit Nonlinear Least-Squares ', self.fitkeys)  
-            self.r1q4 = xrrp(self.qq, *self.pfit)
-
+            # ~ the analytic Jacobian is that of the Nevot-Croce layer model
+            jac = xrrj if self.fitjac and self.engine != 'slab' else None
+            lo = np.array([ bnds.get(j, (-np.inf, np.inf))[0] for j in range(len(pfit)) ])
+            hi = np.array([ bnds.get(j, (-np.inf, np.inf))[1] for j in range(len(pfit)) ])
+            pfit = np.clip(pfit, lo, hi)
+            self.r1q4 = xrrp(self.qq, *pfit)
+            # ~ with fit_lin() the projected problem creeps along a flat valley
+            # ~ after it has converged (default model: err 3.372e-7 after 37
+            # ~ calls, 3.368e-7 after 2100, the maxfev of curve_fit): the
+            # ~ tolerance on the sum of squares is FTOL_LIN there
+            kw = { 'ftol': FTOL_LIN } if self.fit_lin() else {}
             # try using full_output
-            res =  scipy.optimize.curve_fit( xrrp, self.qq, self.yq4, 
-                p0 = self.pfit, full_output=1)
-            popt, pcov, infodict, errmsg, ier = res
+            try:
+                res =  scipy.optimize.curve_fit( xrrp, self.qq, self.yq4, 
+                    p0 = pfit, jac=jac, bounds=(lo, hi), full_output=1, **kw)
+                popt, pcov, infodict, errmsg, ier = res
+            except RuntimeError as e:
+                # ~ maxfev reached: the best parameters evaluated, pcov there
+                errmsg = '!!! ' + str(e) + ' : the best parameters evaluated are kept'
+                popt = best[1]
+                J = self.xrr_jac(full(popt)) if self.engine != 'slab' else None
+                if J is None:
+                    pcov = np.full((len(popt), len(popt)), np.inf)
+                else:
+                    J = J if self.pcon is None else J @ self.pcon.jac(popt)
+                    pcov = self.fit_pcov(J, best[0]**2*len(self.yq4))
             print('_________________________________________________________________')
             print('errmsg =', errmsg)
             # ~ print('ier =', ier)
@@ -635,27 +2006,66 @@ class XRR():
             self.perr = np.sqrt(np.diag(pcov))
             print('perr = ', self.perr)
 
+        if self.fitmode == 2:
+        #=====================
+            # ~ least_squares trf: the physical bounds of fit_bounds() (the ones
+            # ~ of fitcons first), parameters scaled by their magnitudes
+            print('fit bounded trust-region least-squares :', self.fitkeys)
+            lo, hi = self.fit_bounds_free(bnds)
+            pfit = np.clip(pfit, lo, hi)
+            xs = np.where(abs(pfit) > 0, abs(pfit), 1.0)
+
+            # ~ residuals relative to the rms of yq4: the gtol test of trf is absolute
+            ys = np.sqrt(np.mean(self.yq4**2))
+            def xrrr(pw):
+                return (xrrp(self.qq, *pw) - self.yq4)/ys
+            def xrrrj(pw):
+                return xrrj(self.qq, *pw)/ys
+            jac = xrrrj if self.fitjac and self.engine != 'slab' else '2-point'
+            res = scipy.optimize.least_squares(xrrr, pfit, jac=jac, bounds=(lo, hi),
+                x_scale=xs, method='trf')
+            print('_________________________________________________________________')
+            print('message =', res.message, ', nfev =', res.nfev, ', njev =', res.njev)
+
+            self.popt, self.pcov = res.x, self.fit_pcov(res.jac, 2.0*res.cost)
+            self.perr = np.sqrt(np.diag(self.pcov))
+            print('perr = ', self.perr)
+
+        if self.fitmode == 3:
+        #=====================
+            print('fit multi-start trust-region :', self.fitkeys)
+            self.fit_multistart()
+
             
         if self.fitmode is 1:
         #=====================
             print('fit differential evolution :', self.fitkeys)
+            self.fitprec = self.prec
+            self.fitbest = np.inf
 
             bounds = []
-            v = 0.25
-            for p in self.pfit:
-                bounds.append( (p*(1-v), p*(1+v)) )
+            v = self.fitbox
+            for j, p in enumerate(pfit):
+                bounds.append( bnds.get(j, (p*(1-v), p*(1+v))) )
             # ~ print(bounds)
 
             x = [v for v in self.qq]
             y = [v for v in self.yq4]
-            p = [v for v in self.pfit]
+            p = [ min(max(v, b[0]), b[1]) for v, b in zip(pfit, bounds) ]
 
             args = (x, y)
             xrrd(p, *args) # check calling 
 
+            fobj = _XObjective(self)
+            pool = _XPool(fobj, self.nproc) if self.nproc != 1 else None
             cback = Callback()
-            result = differential_evolution(xrrd, bounds, args=args, 
-                disp=True, callback=cback, tol=0.1, maxiter=maxiter)
+            try:
+                result = differential_evolution(xrrv, bounds, args=args, 
+                    disp=True, callback=cback, tol=0.1, maxiter=maxiter,
+                    vectorized=True, updating='deferred')
+            finally:
+                if pool:
+                    pool.close()
             #https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.differential_evolution.html
             # ~ from scipy.optimize import differential_evolution
             # ~ scipy.optimize.differential_evolution(func, bounds, args=(), 
@@ -667,51 +2077,24 @@ class XRR():
             print(result)
         
         ###############################################
-        self.layer_from_fitparam(self.popt)
+        self.pnames = pnames    # of popt, perr
+        self.layer_from_fitparam(full(self.popt))
         self.xrr()
+        if self.fit_lin():
+            self.xrr_ab()
         self.ryq4 = self.yq4 - self.r1q4
         self.post_event(key=0, msg='finished')
 
 
     def xrr(self):
         # ~ where("",3)
-        nL = len(self.LL)
-        nq = len(self.qq)
-        nf = nL -1
-
-        for L in self.LL: L.f_SLD()     # scattering length density
-        SLDN = self.LL[nf].SLD          # sld in last outer layer
-        for L in self.LL:               # K wave vector
-            L.K = np.sqrt(self.qq*self.qq/4.0 - 4.0*np.pi*(L.SLD-SLDN))
-        
-        self.LL[ 0].F[:] = 1.0 + 0j 
-        self.LL[ 0].FA[:]= 1.0 + 0j 
-        self.LL[ 0].R[:] = 0.0 + 0j 
-        self.LL[ 0].Bt[:] = 1.0 + 0j
-        self.LL[nf].Bt[:] = 1.0 + 0j
-        self.LL[ 0].R2[:] = 0.0 
-        
-        R0   = self.LL[0].R
-        K0   = self.LL[0].K
-        sg0  = self.LL[0]._sg
-        
-        for L in self.LL[1:]:
-            L.F     = (L.K - K0)/(L.K + K0)     #Fresnel
-            L.Phi   = L.K * K0 * sg0 * sg0      #phase
-            L.Atn   = np.exp(-L.Phi)            #attenuation
-            L.FA    = L.F * L.Atn               #Fresnel w. attn.
-            
-            L.Bt    = np.exp(-2.0*1j*L.K*abs(L._dd)) #betha
-            
-            L.R     = L.Bt*(R0 + L.FA)/(1.0 + R0*L.FA)  #refl.
-            L.R2    = abs(L.R)**2                       #refl. int.
-            
-            sg0     = L._sg
-            K0      = L.K
-            R0      = L.R
-            
-        self.rr0 = self.LL[nf].R2       # refl. int in last outer layer
-        self.rr1 = abs(self._a0)*self.rr0+abs(self._b0)     # with scale and bgnd
+        self.xrr_sync()
+        # ~ new arrays on every call: a curve kept by the caller (plot, GUI,
+        # ~ an earlier fit) is not overwritten by the next one; refl() returns
+        # ~ a workspace buffer, the copy is small next to the recursion
+        self.rr0 = self.XS.refl().copy()    # refl. int in last outer layer
+        self.clipped = self.XS.clip
+        self.rr1 = abs(self._a0)*self.rr0 + abs(self._b0)   # with scale and bgnd
         
         self.r0q4 = self.qq4*self.rr0
         self.r1q4 = self.qq4*self.rr1
@@ -721,7 +2104,113 @@ class XRR():
 
         return self.r1q4
         
-        
+    def xrr_sync(self, XS=None):
+        # ~ bring the layer stack arrays (self.XS if None) up to date with self.LL
+        XS = self.XS if XS is None else XS
+        if XS.nL != len(self.LL) or XS.qq is not self.qq:
+            XS.layer_init(self.LL, self.qq)
+        else:
+            XS.layer_sync(self.LL)
+        if XS.engine != self.engine or XS.slab != tuple(self.slab):
+            XS.engine = self.engine
+            XS.slab = tuple(self.slab)
+            XS.dirty[:] = True
+
+    def xrr_copy(self):
+        # ~ a copy of self.XS brought up to date with self.LL, for the calls
+        # ~ that are not on the fit path (see _XStack)
+        XS = self.XS.copy()
+        self.xrr_sync(XS)
+        return XS
+        
+    def layer_waves(self):
+        # ~ per-layer F, Phi, Atn, FA, Bt, R, R2 of the last xrr() call, on a
+        # ~ copy of the stack: plot2() comes here from the GUI thread while
+        # ~ the worker thread may be fitting on self.XS and its scratch arrays
+        XS = self.XS.copy()
+        XS.refl()
+        XS.waves(self.LL)
+
+    def xrr_bench(self, depths=(4, 16, 64, 256), nqs=(200, 1000, 5000), nrep=5):
+        # ~ time the parratt and abeles engines on the same synthetic stacks:
+        # ~ the inner layers of self.LL tiled to 'depths' layers, SF interpolated
+        # ~ onto 'nqs' points over the same q range; returns rows of
+        # ~ (depth, nq, ms parratt, ms abeles, max relative deviation)
+        XS = self.xrr_copy()
+        q0 = XS.qq
+        inner = list(range(1, XS.nL-1)) or [0]
+        res = []
+        print('\t depth      nq   parratt ms    abeles ms     rel.dev')
+        for nd in depths:
+            idx = [0] + [ inner[i % len(inner)] for i in range(nd) ] + [XS.nL-1]
+            dd = XS.dd[idx]
+            sg = XS.sg[idx]
+            rh = XS.rh[idx]
+            for nq in nqs:
+                qq = np.linspace(q0.min(), q0.max(), nq)
+                SFn = np.array([ np.interp(qq, q0, XS.SFn[l].real)
+                        + 1j*np.interp(qq, q0, XS.SFn[l].imag) for l in idx ])
+                SLD = rh*SFn
+                K = np.sqrt(qq*qq/4.0 - 4.0*np.pi*(SLD - SLD[-1]))
+                RN = {}
+                ms = {}
+                for engine in ('parratt', 'abeles'):
+                    t0 = time.time()
+                    for n in range(nrep):
+                        FA = np.ones_like(K)
+                        Bt = np.ones_like(K)
+                        if engine == 'abeles':
+                            RN[engine] = abeles(K, dd, sg, FA, Bt)
+                        else:
+                            RN[engine] = parratt(K, dd, sg, FA, Bt, np.zeros_like(K))
+                    ms[engine] = 1000.0*(time.time() - t0)/nrep
+                dev = np.max(abs(RN['abeles'] - RN['parratt'])/abs(RN['parratt']))
+                print('\t %5d %7d %12.3f %12.3f %11.2e' % (nd+2, nq, ms['parratt'], ms['abeles'], dev))
+                res.append((nd+2, nq, ms['parratt'], ms['abeles'], dev))
+        return res
+
+    def xrr_bench_batch(self, nqs=(100, 300, 1000, 5000), ncand=64, nrep=3,
+                        nbatches=(1, 4, 16, 64, None), v=0.05):
+        # ~ time refl_batch() per candidate on ncand random candidates (+/- v
+        # ~ around the fit parameters), the SF interpolated onto 'nqs' points,
+        # ~ for each chunk size (None: batch_size()); and xrr() one candidate
+        # ~ at a time on the data grid; returns rows (nq, nbatch, us/candidate)
+        self.layer_to_fitparam()
+        p = np.array(self.pfit)
+        P = p*(1.0 + v*np.random.RandomState(0).uniform(-1, 1, (ncand, len(p))))
+        a0, b0, dd, sg, rh = self.layer_from_fitparam_batch(P)
+        XS = self.XS.copy()
+        q0 = XS.qq
+
+        def best(f):
+            t = np.inf
+            for n in range(nrep):
+                t0 = time.perf_counter()
+                f()
+                t = min(t, time.perf_counter() - t0)
+            return 1.0E6*t/ncand
+
+        def serial():
+            for pp in P:
+                self.layer_from_fitparam(pp)
+                self.xrr()
+        res = [ (len(q0), 'xrr()', best(serial)) ]
+        self.layer_from_fitparam(p)
+        self.xrr()
+        print('\t     nq       nbatch   us/candidate')
+        print('\t %6d %12s %12.1f' % res[0])
+        for nq in nqs:
+            qq = np.linspace(q0.min(), q0.max(), nq)
+            SFn = np.array([ np.interp(qq, q0, XS.SFn[l].real)
+                    + 1j*np.interp(qq, q0, XS.SFn[l].imag) for l in range(XS.nL) ])
+            for nb in nbatches:
+                us = best(lambda: XS.refl_batch(dd, sg, rh, nb, SFn=SFn, q2=qq*qq/4.0))
+                nbs = 'auto %d' % batch_size(XS.nL, nq) if nb is None else str(nb)
+                print('\t %6d %12s %12.1f' % (nq, nbs, us))
+                res.append((nq, nbs, us))
+        return res
+
+
     def layer_profile(self):
         where("",self.whrn)
         # ~ print('\t XRR.layer_profile(), fitn=', self.fitn)
@@ -734,9 +2223,10 @@ class XRR():
             return np.array( [ (y2 - y1)*(1. + erf( (xi - x0)/sg) )/2. for xi in x ] )
 
         t0 = time.time()
-        L_dd = np.asarray([ L._dd for L in self.LL ])
-        L_sg = np.asarray([ L._sg for L in self.LL ])
-        L_rh = np.asarray([ L._rh for L in self.LL ])
+        LU = self.layer_unroll()
+        L_dd = np.asarray([ L._dd for L in LU ])
+        L_sg = np.asarray([ L._sg for L in LU ])
+        L_rh = np.asarray([ L._rh for L in LU ])
         
         nl = len(L_dd)
 
@@ -775,7 +2265,7 @@ class XRR():
         
         # for each layer type get composition in each layer
         atoms = []
-        for L in self.LL:
+        for L in LU:
             for a in L.AtomS:
                 if a not in atoms:
                     atoms.append(a)
@@ -783,7 +2273,7 @@ class XRR():
         atomc = []
         for a in atoms:
             LC = []
-            for L in self.LL:
+            for L in LU:
                 if a in L.AtomS:
                     p = L.AtomS.index(a)
                     c = L.AtomN[p]
@@ -2565,6 +4055,23 @@ def scipy_optimize_differential_evolution_test():
     args = (x,y)
     result = differential_evolution(func, bounds, args=args)
     print(result.x)
+
+
+def fit_lin_test():
+    # ~ fitmode 0 on the default model with and without fit_lin(): both
+    # ~ converge (no RuntimeError of curve_fit), the projected fit at least
+    # ~ as well as the plain one; returns True if so
+    res = {}
+    for lin in (False, True):
+        X = XRR()
+        X.fitmode, X.fitlin = 0, lin
+        X.fit()
+        res[lin] = (X.fitn, np.sqrt(np.mean((X.yq4 - X.r1q4)**2)))
+        print('fitlin', lin, ': fitn %d, err %.4e' % res[lin])
+    ok = res[True][1] <= 1.01*res[False][1]
+    if not ok:
+        print('!!! fit_lin_test: the projected L-M fit is worse than the plain one')
+    return ok
     
     
 if __name__ == "__main__":
@@ -64,7 +64,7 @@ class XRR_wx(XRR):
         # ~ print(key, data, message, end='', flush=True)
         # ~ # can be redifined when the class is overloaded
         # ~ self.pyqtsig_val.emit(data)
-        m = {0:'L-M', 1:'D-E'}
+        m = {0:'L-M', 1:'D-E', 2:'T-R', 3:'M-S'}
         d = {'@':'XRR', 'fit':m[self.fitmode], 'fitn':self.fitn}
         d.update(kw)
         # ~ print(d)